@@ -74,11 +74,26 @@ Usage Examples:
 
 from __future__ import annotations
 import contextlib, argparse
-import json, sys
+import gzip
+import hashlib
+import io
+import pickle
+import sys
 from pathlib import Path
-from typing  import Any, Dict, List, Tuple, Set, Optional, Type
+from typing  import Any, Callable, ClassVar, Dict, List, Mapping, Sequence, Tuple, Set, Optional, Type, NamedTuple
 from dataclasses import dataclass, field
 from enum import IntEnum
+from array import array
+from abc import ABC, abstractmethod
+import functools
+from itertools import islice
+from collections import deque
+from types import MappingProxyType
+
+try:  # orjson is optional: a faster C parser with the same loads() API
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 # Heuristic threshold for detecting numeric asset references.
 # Cocos Creator packs often use large integer values for asset IDs.
@@ -90,6 +105,7 @@ ASSET_REF_THRESHOLD = 10000
 IDX_OVR   = 3          # components / overrides list
 IDX_SIZE  = 5          # [flag, width, height]
 IDX_TRS   = 6          # [px,py,pz, rx,ry,rz, sx,sy,sz, …]
+_TRS_PROBE = (IDX_TRS, IDX_TRS-1, IDX_TRS+1, -1)  # row slots _find_trs checks, in order
 
 # ────────────── Engine Value Types and Deserializer ──────────────
 
@@ -103,20 +119,20 @@ class ValueTypeID(IntEnum):
     Rect  = 6
     Mat4  = 7
 
-@dataclass
+@dataclass(slots=True)
 class Vec2:
     x: float
     y: float
     def __str__(self): return f"({self.x},{self.y})"
 
-@dataclass
+@dataclass(slots=True)
 class Vec3:
     x: float
     y: float
     z: float
     def __str__(self): return f"({self.x},{self.y},{self.z})"
 
-@dataclass
+@dataclass(slots=True)
 class Vec4:
     x: float
     y: float
@@ -124,7 +140,7 @@ class Vec4:
     w: float
     def __str__(self): return f"({self.x},{self.y},{self.z},{self.w})"
 
-@dataclass
+@dataclass(slots=True)
 class Quat:
     x: float
     y: float
@@ -132,7 +148,7 @@ class Quat:
     w: float
     def __str__(self): return f"quat({self.x},{self.y},{self.z},{self.w})"
 
-@dataclass
+@dataclass(slots=True)
 class Rect:
     x: float
     y: float
@@ -140,15 +156,51 @@ class Rect:
     height: float
     def __str__(self): return f"rect({self.x},{self.y},{self.width},{self.height})"
 
-@dataclass
+def _mat4_elem(i: int) -> property:
+    return property(lambda self: self._d[i], doc=f"Element [row {i // 4}, col {i % 4}]")
+
+_MAT4_ZERO = array('f', bytes(16 * 4))
+
 class Mat4:
-    m00: float; m01: float; m02: float; m03: float
-    m10: float; m11: float; m12: float; m13: float
-    m20: float; m21: float; m22: float; m23: float
-    m30: float; m31: float; m32: float; m33: float
-    def __str__(self): return f"mat4([{self.m00},{self.m01},{self.m02},{self.m03}|{self.m10},{self.m11},{self.m12},{self.m13}|{self.m20},{self.m21},{self.m22},{self.m23}|{self.m30},{self.m31},{self.m32},{self.m33}])"
+    """4×4 matrix stored as one contiguous float32 block (16 × 4 bytes).
 
-@dataclass
+    Elements are exposed row-major as read-only ``m00 … m33`` properties
+    instead of 16 separate float objects per matrix.
+    """
+    __slots__ = ("_d",)
+
+    def __init__(self, *vals: float) -> None:
+        self._d = array('f', vals)
+
+    @classmethod
+    def _from_row(cls, comps: List[Any]) -> "Mat4":
+        """Build from the first 16 components with a single typed-array copy.
+
+        Short (malformed or compact) data is zero-filled from a shared
+        zero block rather than padding the source list.
+        """
+        m = cls.__new__(cls)
+        d = m._d = array('f', comps[:16])
+        if len(d) < 16:
+            d.extend(_MAT4_ZERO[len(d):])
+        return m
+
+    m00 = _mat4_elem(0);  m01 = _mat4_elem(1);  m02 = _mat4_elem(2);  m03 = _mat4_elem(3)
+    m10 = _mat4_elem(4);  m11 = _mat4_elem(5);  m12 = _mat4_elem(6);  m13 = _mat4_elem(7)
+    m20 = _mat4_elem(8);  m21 = _mat4_elem(9);  m22 = _mat4_elem(10); m23 = _mat4_elem(11)
+    m30 = _mat4_elem(12); m31 = _mat4_elem(13); m32 = _mat4_elem(14); m33 = _mat4_elem(15)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Mat4) and self._d == other._d
+
+    def __repr__(self) -> str:
+        return f"Mat4({', '.join(map(repr, self._d))})"
+
+    def __str__(self):
+        v = [format(x, ".7g") for x in self._d]  # float32 carries ~7 significant digits
+        return f"mat4([{','.join(v[0:4])}|{','.join(v[4:8])}|{','.join(v[8:12])}|{','.join(v[12:16])}])"
+
+@dataclass(slots=True)
 class Color:
     r: int
     g: int
@@ -156,12 +208,60 @@ class Color:
     a: int
     def __str__(self): return f"rgba({self.r},{self.g},{self.b},{self.a})"
 
-@dataclass
+    @classmethod
+    def from_row(cls, color_col: array, row_idx: int) -> "Color":
+        """Materialize a Color from a flat RGBA uint8 column (see NodeTable.color)."""
+        base = row_idx * 4
+        return cls(*color_col[base:base + 4])
+
+@dataclass(slots=True)
 class Size:
     width: float
     height: float
     def __str__(self): return f"({self.width}×{self.height})"
 
+# ───────────── per-type decoders (indexed by ValueTypeID value) ─────────────
+# Each takes the full value-type array [type_id, ...components].
+
+def _dec_vec2(arr: List[Any]) -> Vec2:
+    return Vec2(arr[1], arr[2])
+
+def _dec_vec3(arr: List[Any]) -> Vec3:
+    return Vec3(arr[1], arr[2], arr[3])
+
+def _dec_vec4(arr: List[Any]) -> Vec4:
+    return Vec4(arr[1], arr[2], arr[3], arr[4])
+
+def _dec_quat(arr: List[Any]) -> Quat:
+    return Quat(arr[1], arr[2], arr[3], arr[4])
+
+def _dec_color(arr: List[Any]) -> Color:
+    # Packed ARGB, RGBA and RGB layouts are all resolved by color_channels
+    return Color(*ValueTypeDeserializer.color_channels(arr[1:]))
+
+def _dec_size(arr: List[Any]) -> Size:
+    return Size(arr[1], arr[2])
+
+def _dec_rect(arr: List[Any]) -> Rect:
+    return Rect(arr[1], arr[2], arr[3], arr[4])
+
+def _dec_mat4(arr: List[Any]) -> Mat4:
+    # Incomplete matrix data is zero-filled by _from_row
+    return Mat4._from_row(arr[1:17])
+
+# Jump table for ValueTypeDeserializer.decode. Position must match the
+# ValueTypeID value; the enum itself is not consulted at dispatch time.
+_DECODERS: Tuple[Callable[[List[Any]], Any], ...] = (
+    _dec_vec2,   # ValueTypeID.Vec2  = 0
+    _dec_vec3,   # ValueTypeID.Vec3  = 1
+    _dec_vec4,   # ValueTypeID.Vec4  = 2
+    _dec_quat,   # ValueTypeID.Quat  = 3
+    _dec_color,  # ValueTypeID.Color = 4
+    _dec_size,   # ValueTypeID.Size  = 5
+    _dec_rect,   # ValueTypeID.Rect  = 6
+    _dec_mat4,   # ValueTypeID.Mat4  = 7
+)
+
 class ValueTypeDeserializer:
     """Central value-type array decoder for Cocos Creator format.
     
@@ -180,10 +280,12 @@ class ValueTypeDeserializer:
         Returns:
             True if arr is a valid value-type array format
         """
-        return (isinstance(arr, list) and 
-                len(arr) > 0 and 
-                isinstance(arr[0], int) and 
-                0 <= arr[0] <= 7)
+        # Exact type checks: packed JSON never yields list/int subclasses,
+        # and bools must not count as a type id
+        if type(arr) is not list or not arr:
+            return False
+        t0 = arr[0]
+        return type(t0) is int and 0 <= t0 <= 7
 
     @staticmethod
     def decode(arr: List[Any]) -> Any:
@@ -199,66 +301,109 @@ class ValueTypeDeserializer:
             decode([0, 10.5, 20.0]) → Vec2(10.5, 20.0)
             decode([4, 0xFF8080FF]) → Color(128, 128, 255, 255)
             decode([5, 100, 50]) → Size(100.0, 50.0)
+
+        Vec3 (node transforms) and packed Color (tints) are by far the
+        most common ids and are decoded inline before the jump table.
+        These literals are the ValueTypeID values; keep them in sync if
+        the enum is ever renumbered.
         """
-        vt_id, comps = arr[0], arr[1:]
-        
-        if vt_id == ValueTypeID.Vec2:
-            return Vec2(comps[0], comps[1])
-        
-        if vt_id == ValueTypeID.Vec3:
-            return Vec3(comps[0], comps[1], comps[2])
-        
-        if vt_id == ValueTypeID.Vec4:
-            return Vec4(comps[0], comps[1], comps[2], comps[3])
-        
-        if vt_id == ValueTypeID.Quat:
-            return Quat(comps[0], comps[1], comps[2], comps[3])
-        
-        if vt_id == ValueTypeID.Color:
-            if len(comps) == 1 and isinstance(comps[0], int):
-                # Packed color format (ARGB)
-                packed = comps[0]
-                a = (packed >> 24) & 0xFF
-                r = (packed >> 16) & 0xFF
-                g = (packed >> 8)  & 0xFF
-                b = (packed >> 0)  & 0xFF
-                return Color(r, g, b, a)
-            elif len(comps) == 4:
-                # RGBA list format
-                return Color(int(comps[0]), int(comps[1]), int(comps[2]), int(comps[3]))
-            elif len(comps) == 3:
-                # RGB list format (assume full alpha)
-                return Color(int(comps[0]), int(comps[1]), int(comps[2]), 255)
-            else:
-                # Fallback to white
-                return Color(255, 255, 255, 255)
-        
-        if vt_id == ValueTypeID.Size:
-            return Size(comps[0], comps[1])
-        
-        if vt_id == ValueTypeID.Rect:
-            return Rect(comps[0], comps[1], comps[2], comps[3])
-        
-        if vt_id == ValueTypeID.Mat4:
-            if len(comps) >= 16:
-                return Mat4(
-                    comps[0], comps[1], comps[2], comps[3],
-                    comps[4], comps[5], comps[6], comps[7],
-                    comps[8], comps[9], comps[10], comps[11],
-                    comps[12], comps[13], comps[14], comps[15]
-                )
-            else:
-                # Fallback for incomplete matrix data
-                padded = comps + [0.0] * (16 - len(comps))
-                return Mat4(
-                    padded[0], padded[1], padded[2], padded[3],
-                    padded[4], padded[5], padded[6], padded[7],
-                    padded[8], padded[9], padded[10], padded[11],
-                    padded[12], padded[13], padded[14], padded[15]
-                )
-        
+        vt_id = arr[0]
+        if not isinstance(vt_id, int):
+            return arr
+        if vt_id == 1:  # ValueTypeID.Vec3
+            return Vec3(arr[1], arr[2], arr[3])
+        if vt_id == 4 and len(arr) == 2 and isinstance(arr[1], int):  # packed ARGB Color
+            p = arr[1]
+            return Color((p >> 16) & 0xFF, (p >> 8) & 0xFF, p & 0xFF, (p >> 24) & 0xFF)
+        if 0 <= vt_id < len(_DECODERS):
+            return _DECODERS[vt_id](arr)
         return arr
-    
+
+    @staticmethod
+    def color_channels(comps: List[Any]) -> Tuple[int, int, int, int]:
+        """Resolve Color components to an (r, g, b, a) tuple.
+
+        Args:
+            comps: Color components after the type id (packed ARGB int,
+                   RGBA list or RGB list)
+
+        Returns:
+            Tuple of 0-255 channel values, white if the layout is unknown
+        """
+        if len(comps) == 1 and isinstance(comps[0], int):
+            # Packed color format (ARGB)
+            packed = comps[0]
+            a = (packed >> 24) & 0xFF
+            r = (packed >> 16) & 0xFF
+            g = (packed >> 8)  & 0xFF
+            b = (packed >> 0)  & 0xFF
+            return (r, g, b, a)
+        elif len(comps) == 4:
+            # RGBA list format
+            return (int(comps[0]), int(comps[1]), int(comps[2]), int(comps[3]))
+        elif len(comps) == 3:
+            # RGB list format (assume full alpha)
+            return (int(comps[0]), int(comps[1]), int(comps[2]), 255)
+        else:
+            # Fallback to white
+            return (255, 255, 255, 255)
+
+    @staticmethod
+    def decode_into(arr: List[Any], out_table: "NodeTable", row_idx: int) -> bool:
+        """Decode a value-type array directly into a :class:`NodeTable` row.
+
+        Only value types backed by a table column (Size, Color) are written;
+        no intermediate dataclass is allocated.
+
+        Args:
+            arr: Value-type array in format [type_id, ...components]
+            out_table: Preallocated node table to write into
+            row_idx: Node row id within the table
+
+        Returns:
+            True if the value was stored, False if the type has no column
+        """
+        vt_id = arr[0]
+
+        if vt_id == ValueTypeID.Size and len(arr) >= 3:
+            col, base = out_table.size, row_idx * 3
+            col[base], col[base + 1], col[base + 2] = vt_id, arr[1], arr[2]
+            out_table.flags[row_idx] |= NODE_HAS_SIZE
+            return True
+
+        if vt_id == ValueTypeID.Color:
+            col, base = out_table.color, row_idx * 4
+            col[base:base + 4] = array('B', [c & 0xFF for c in ValueTypeDeserializer.color_channels(arr[1:])])
+            out_table.flags[row_idx] |= NODE_HAS_COLOR
+            return True
+
+        return False
+
+    @staticmethod
+    def decode_batch_colors(packed_arr: array) -> array:
+        """Unpack many packed ARGB colors at once into a flat RGBA uint8 array.
+
+        The channel split is done on the raw bytes of the uint32 array with
+        strided slice copies, so the per-color work runs in C rather than as
+        four Python shift/mask operations per value.
+
+        Args:
+            packed_arr: array('I') of packed 0xAARRGGBB values
+
+        Returns:
+            array('B') of length 4*N laid out as r,g,b,a per color
+        """
+        if sys.byteorder == "big":
+            packed_arr = array('I', packed_arr)
+            packed_arr.byteswap()
+        raw = packed_arr.tobytes()  # little-endian: b,g,r,a per color
+        rgba = bytearray(len(raw))
+        rgba[0::4] = raw[2::4]
+        rgba[1::4] = raw[1::4]
+        rgba[2::4] = raw[0::4]
+        rgba[3::4] = raw[3::4]
+        return array('B', rgba)
+
     @staticmethod
     def decode_ref(idx: int) -> Tuple[str, int]:
         """Decode template/asset reference indices to (kind, idx) tuple.
@@ -294,63 +439,244 @@ class ValueTypeDeserializer:
             # idx == 0, could be null reference or root node
             return ('node', idx)
 
+# ─────────────────────────── Columnar node table ────────────────────────────
+
+# NodeTable.flags bits: which columns were present in the packed row
+NODE_HAS_TRS   = 1
+NODE_HAS_SIZE  = 2
+NODE_HAS_COLOR = 4
+
+# Zero position/rotation, unit scale
+_TRS_IDENTITY = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+
+class Vec3Row(NamedTuple):
+    """Read-only Vec3 view of one NodeTable triple."""
+    x: float
+    y: float
+    z: float
+
+def _find_trs(node_row: List[Any]) -> Optional[List[Any]]:
+    """Locate packed transform data [px,py,pz, rx,ry,rz, sx,sy,sz, …] in a node row."""
+    n = len(node_row)
+    for idx in _TRS_PROBE:  # Last item sometimes contains transforms
+        if (idx == -1 and n > 0) or (0 <= idx < n):
+            candidate = node_row[idx]
+            if type(candidate) is list and len(candidate) >= 9:
+                # Looks like transform data if the first 9 items are numbers;
+                # array('d') runs that type check for all of them in one C call
+                try:
+                    array('d', candidate[:9])
+                except (TypeError, OverflowError):
+                    continue
+                return candidate
+    return None
+
+def _child_offsets(node_row: List[Any]) -> Optional[List[Any]]:
+    """First non-empty all-numeric list in ``node_row[3:]`` (packed child offsets), else None."""
+    if len(node_row) <= 3:
+        return None
+    for lst in islice(node_row, 3, None):  # no per-row slice copy
+        if isinstance(lst, list) and lst:
+            # Numeric-list check in one C call (array('d') rejects non-numbers)
+            try:
+                array('d', lst)
+            except (TypeError, OverflowError):
+                continue
+            return lst
+    return None
+
+def _node_blocks(q: list) -> List[list]:
+    """Flatten the nested data blocks of a pack into lists of packed rows."""
+    out,ql=[],deque(q)
+    while ql:
+        b=ql.popleft()
+        if isinstance(b,list):
+            if b and isinstance(b[0],list) and isinstance(b[0][0],int): out.append(b)
+            elif b and isinstance(b[0],list): ql.extendleft(reversed(b))
+    return out
+
+@dataclass(slots=True)
+class NodeTable:
+    """Columnar (SoA) storage for decoded per-node transform, size and color data.
+
+    Instead of one Vec3/Size/Color object per value, every field lives in a
+    single contiguous typed array indexed by node row id. Row ids count the
+    packed rows of all node blocks in ``data[5:]`` in order; the first row
+    id of each block is kept in ``block_offsets``.
+
+    Column layout for row ``i``:
+        trs[i*9 : i*9+9]   = px,py,pz, rx,ry,rz, sx,sy,sz   (float64)
+        size[i*3 : i*3+3]  = flag, width, height             (float64)
+        color[i*4 : i*4+4] = r, g, b, a                       (uint8)
+        flags[i]           = NODE_HAS_* bits for present columns
+    """
+    count: int
+    trs: array
+    size: array
+    color: array
+    flags: array
+    block_offsets: List[int] = field(default_factory=list)
+
+    @classmethod
+    def allocate(cls, count: int) -> "NodeTable":
+        """Preallocate zero-filled columns for ``count`` nodes (colors default to white)."""
+        return cls(
+            count=count,
+            trs=array('d', bytes(8 * 9 * count)),
+            size=array('d', bytes(8 * 3 * count)),
+            color=array('B', b"\xff" * (4 * count)),
+            flags=array('B', bytes(count)),
+        )
+
+    @classmethod
+    def from_blocks(cls, blocks: List[list]) -> "NodeTable":
+        """Build the table from packed node blocks in a single fill pass."""
+        table = cls.allocate(sum(len(b) for b in blocks))
+        trs_col, flags = table.trs, table.flags
+        # Packed [4, argb] colors are gathered and unpacked in one batch below
+        packed_rows, packed_vals = [], array('I')
+        row_idx = 0
+        for block in blocks:
+            table.block_offsets.append(row_idx)
+            for row in block:
+                if isinstance(row, list):
+                    trs = _find_trs(row)
+                    if trs is not None:
+                        trs_col[row_idx * 9:row_idx * 9 + 9] = array('d', trs[:9])
+                        flags[row_idx] |= NODE_HAS_TRS
+                    if len(row) > IDX_SIZE and ValueTypeDeserializer.is_value_array(row[IDX_SIZE]):
+                        ValueTypeDeserializer.decode_into(row[IDX_SIZE], table, row_idx)
+                    for value in row[IDX_OVR + 1:]:
+                        if (ValueTypeDeserializer.is_value_array(value) and
+                                value[0] == ValueTypeID.Color and len(value) in (2, 4, 5)):
+                            if len(value) == 2 and isinstance(value[1], int):
+                                packed_rows.append(row_idx)
+                                packed_vals.append(value[1] & 0xFFFFFFFF)
+                            else:
+                                ValueTypeDeserializer.decode_into(value, table, row_idx)
+                            break
+                row_idx += 1
+
+        if packed_rows:
+            rgba = ValueTypeDeserializer.decode_batch_colors(packed_vals)
+            color_col = table.color
+            for k, r in enumerate(packed_rows):
+                color_col[r * 4:r * 4 + 4] = rgba[k * 4:k * 4 + 4]
+                flags[r] |= NODE_HAS_COLOR
+        return table
+
+    def row_id(self, block_id: int, i: int) -> int:
+        """Map a (block, local row) pair to the table's row id."""
+        return self.block_offsets[block_id] + i
+
+    def has(self, row_idx: int, flag: int) -> bool:
+        return 0 <= row_idx < self.count and bool(self.flags[row_idx] & flag)
+
+    def trs_row(self, row_idx: int) -> array:
+        base = row_idx * 9
+        return self.trs[base:base + 9]
+
+    def vec3(self, row_idx: int, part: int = 0) -> Vec3Row:
+        """Vec3 view of a TRS triple: part 0 = position, 1 = rotation, 2 = scale."""
+        base = row_idx * 9 + part * 3
+        t = self.trs
+        return Vec3Row(t[base], t[base + 1], t[base + 2])
+
+    def size_of(self, row_idx: int) -> Size:
+        base = row_idx * 3
+        return Size(self.size[base + 1], self.size[base + 2])
+
+    def color_of(self, row_idx: int) -> Color:
+        return Color.from_row(self.color, row_idx)
+
 # ──────────────────────── CLASS INDEX MAPPING REFERENCE ───────────────────────
 
-# Comprehensive class index mapping derived from pack format analysis
-CLASS_INDEX_REFERENCE = {
-    # Core Cocos Creator Classes
-    "cc.Node": {
-        "common_props": ["_name", "_active", "_parent", "_components", "_prefab", "_contentSize", "_trs", "_children", "_anchorPoint", "_color"],
-        "full_props": ["_name", "_opacity", "_objFlags", "_active", "_id", "_components", "_contentSize", "_parent", "_prefab", "_trs", "_children", "_anchorPoint", "_color"]
-    },
-    "cc.Label": {
-        "props": ["_N$verticalAlign", "_N$horizontalAlign", "_string", "_fontSize", "_isSystemFontUsed", "_N$cacheMode", "_lineHeight", "_styleFlags", "_N$overflow", "_enableWrapText", "node", "_materials", "_N$file"]
-    },
-    "cc.Sprite": {
-        "props": ["_sizeMode", "_type", "_isTrimmedMode", "_enabled", "_dstBlendFactor", "_fillRange", "node", "_materials", "_spriteFrame"]
-    },
-    "cc.Button": {
-        "props": ["zoomScale", "_N$transition", "_N$enableAutoGrayEffect", "node", "clickEvents", "_N$pressedColor", "_N$disabledColor", "_N$target", "_N$normalColor", "_N$normalSprite", "_N$pressedSprite", "_N$hoverSprite", "_N$disabledSprite"]
-    },
-    "cc.Widget": {
-        "props": ["_alignFlags", "_originalWidth", "_left", "_right", "_bottom", "_top", "_originalHeight", "alignMode", "_enabled", "node", "_target"]
-    },
-    "cc.Animation": {
-        "props": ["playOnLoad", "node", "_clips", "_defaultClip"]
-    },
-    "cc.AnimationClip": {
-        "props": ["_name", "_duration", "sample", "wrapMode", "speed", "curveData"]
-    },
-    "cc.ParticleSystem": {
-        "props": ["_dstBlendFactor", "_custom", "totalParticles", "emissionRate", "life", "angle", "angleVar", "speed", "tangentialAccel", "lifeVar", "startSize", "speedVar", "endSize", "_positionType", "endRadius", "startSizeVar", "endSizeVar", "endSpinVar", "emitterMode", "endRadiusVar", "startRadius", "duration", "radialAccelVar", "node", "_materials", "_startColor", "_startColorVar", "_endColor", "_endColorVar", "posVar", "_file", "_spriteFrame", "gravity"]
-    },
-    "cc.ProgressBar": {
-        "props": ["_N$mode", "_N$progress", "_N$totalLength", "node", "_N$barSprite"]
-    },
-    "cc.Slider": {
-        "props": ["_N$progress", "node", "slideEvents", "_N$handle"]
-    },
-    "cc.ScrollView": {
-        "props": ["horizontal", "brake", "bounceDuration", "_N$horizontalScrollBar", "_N$verticalScrollBar", "node", "_N$content"]
-    },
-    "cc.Layout": {
-        "props": ["_resize", "_N$layoutType", "_N$paddingLeft", "_N$spacingX", "_N$spacingY", "_N$paddingRight", "_enabled", "node", "_layoutSize"]
-    },
-    "cc.Mask": {
-        "props": ["_N$alphaThreshold", "_type", "node", "_materials", "_spriteFrame"]
-    },
-    "cc.Canvas": {
-        "props": ["_fitWidth", "node", "_designResolution"]
-    },
-    "cc.Camera": {
-        "props": ["_clearFlags", "_depth", "node"]
-    },
-    "cc.Scene": {
-        "props": ["_name", "_active", "autoReleaseAssets", "_children", "_anchorPoint", "_trs"]
+@functools.cache
+def _class_index_ref() -> Mapping[str, Mapping[str, Tuple[str, ...]]]:
+    """Comprehensive class index mapping derived from pack format analysis.
+
+    Built on first use rather than at import, so paths that never resolve
+    class templates (e.g. ``--test``) don't allocate it. Property names are
+    interned so the names copied into ClassTemplateInfo.properties (and used
+    as component property keys) are shared objects.
+    """
+    ref = {
+        # Core Cocos Creator Classes
+        "cc.Node": {
+            "common_props": ["_name", "_active", "_parent", "_components", "_prefab", "_contentSize", "_trs", "_children", "_anchorPoint", "_color"],
+            "full_props": ["_name", "_opacity", "_objFlags", "_active", "_id", "_components", "_contentSize", "_parent", "_prefab", "_trs", "_children", "_anchorPoint", "_color"]
+        },
+        "cc.Label": {
+            "props": ["_N$verticalAlign", "_N$horizontalAlign", "_string", "_fontSize", "_isSystemFontUsed", "_N$cacheMode", "_lineHeight", "_styleFlags", "_N$overflow", "_enableWrapText", "node", "_materials", "_N$file"]
+        },
+        "cc.Sprite": {
+            "props": ["_sizeMode", "_type", "_isTrimmedMode", "_enabled", "_dstBlendFactor", "_fillRange", "node", "_materials", "_spriteFrame"]
+        },
+        "cc.Button": {
+            "props": ["zoomScale", "_N$transition", "_N$enableAutoGrayEffect", "node", "clickEvents", "_N$pressedColor", "_N$disabledColor", "_N$target", "_N$normalColor", "_N$normalSprite", "_N$pressedSprite", "_N$hoverSprite", "_N$disabledSprite"]
+        },
+        "cc.Widget": {
+            "props": ["_alignFlags", "_originalWidth", "_left", "_right", "_bottom", "_top", "_originalHeight", "alignMode", "_enabled", "node", "_target"]
+        },
+        "cc.Animation": {
+            "props": ["playOnLoad", "node", "_clips", "_defaultClip"]
+        },
+        "cc.AnimationClip": {
+            "props": ["_name", "_duration", "sample", "wrapMode", "speed", "curveData"]
+        },
+        "cc.ParticleSystem": {
+            "props": ["_dstBlendFactor", "_custom", "totalParticles", "emissionRate", "life", "angle", "angleVar", "speed", "tangentialAccel", "lifeVar", "startSize", "speedVar", "endSize", "_positionType", "endRadius", "startSizeVar", "endSizeVar", "endSpinVar", "emitterMode", "endRadiusVar", "startRadius", "duration", "radialAccelVar", "node", "_materials", "_startColor", "_startColorVar", "_endColor", "_endColorVar", "posVar", "_file", "_spriteFrame", "gravity"]
+        },
+        "cc.ProgressBar": {
+            "props": ["_N$mode", "_N$progress", "_N$totalLength", "node", "_N$barSprite"]
+        },
+        "cc.Slider": {
+            "props": ["_N$progress", "node", "slideEvents", "_N$handle"]
+        },
+        "cc.ScrollView": {
+            "props": ["horizontal", "brake", "bounceDuration", "_N$horizontalScrollBar", "_N$verticalScrollBar", "node", "_N$content"]
+        },
+        "cc.Layout": {
+            "props": ["_resize", "_N$layoutType", "_N$paddingLeft", "_N$spacingX", "_N$spacingY", "_N$paddingRight", "_enabled", "node", "_layoutSize"]
+        },
+        "cc.Mask": {
+            "props": ["_N$alphaThreshold", "_type", "node", "_materials", "_spriteFrame"]
+        },
+        "cc.Canvas": {
+            "props": ["_fitWidth", "node", "_designResolution"]
+        },
+        "cc.Camera": {
+            "props": ["_clearFlags", "_depth", "node"]
+        },
+        "cc.Scene": {
+            "props": ["_name", "_active", "autoReleaseAssets", "_children", "_anchorPoint", "_trs"]
+        }
+    }
+    return MappingProxyType({
+        sys.intern(name): MappingProxyType({k: tuple(sys.intern(n) for n in v) for k, v in entry.items()})
+        for name, entry in ref.items()
+    })
+
+@functools.cache
+def _class_props() -> Dict[str, Tuple[str, ...]]:
+    """Resolved reference property list per class, derived once from
+    :func:`_class_index_ref`. Keys are interned so lookups with interned
+    class names hit on identity."""
+    return {
+        name: entry.get("props") or entry.get("common_props") or ()
+        for name, entry in _class_index_ref().items()
     }
-}
 
-@dataclass
+# Interned "prop_<idx>" fallback names, shared by every template and decoder
+# that uses them; indices past the table are interned on demand
+_PROP_IDX_NAMES: Tuple[str, ...] = tuple(sys.intern(f"prop_{i}") for i in range(256))
+
+def _prop_fallback_name(idx: int) -> str:
+    if 0 <= idx < 256:
+        return _PROP_IDX_NAMES[idx]
+    return sys.intern(f"prop_{idx}")
+
+@dataclass(slots=True)
 class ClassTemplateInfo:
     """Enhanced class template information with property mapping.
     
@@ -360,13 +686,15 @@ class ClassTemplateInfo:
     Attributes:
         tpl_index: Template index in the templates array
         class_name: Cocos Creator class name (e.g., "cc.Label", "cc.Sprite")
-        properties: Ordered list of property names for this template
-        extra_data: Additional template data beyond the basic class definition
+        properties: Ordered property names for this template (shared between
+                    templates that resolve to the same names)
+        extra_data: Additional template data beyond the basic class definition,
+                    packed as array('i') (plain list if not all ints)
     """
     tpl_index: int
     class_name: str
-    properties: List[str]
-    extra_data: List[int]
+    properties: Tuple[str, ...]
+    extra_data: Sequence[Any] = field(default_factory=lambda: array('i'))
     
     def get_property_at_index(self, index: int) -> Optional[str]:
         """Get property name at specific index, if available.
@@ -384,7 +712,85 @@ class ClassTemplateInfo:
             return self.properties[index]
         return None
 
-@dataclass 
+def _build_class_templates(templates: List[Any],
+                           class_definitions: List[Any],
+                           property_names: List[str]) -> List[Optional[ClassTemplateInfo]]:
+    """Resolve every template to its class name and ordered property names.
+
+    Kept as a plain module-level function over explicitly typed arguments
+    (no ``self`` attribute traffic, closures or dynamic attributes) so the
+    loop runs on fast locals and can be compiled unchanged with mypyc.
+
+    Args:
+        templates: Raw template table (data[4])
+        class_definitions: Raw class definitions (data[3])
+        property_names: Global property name table (data[2])
+
+    Returns:
+        Dense list indexed by template index; None for unresolvable templates
+    """
+    class_templates: List[Optional[ClassTemplateInfo]] = [None] * len(templates)
+    pn, n_pn = property_names, len(property_names)
+    cds, n_cds = class_definitions, len(class_definitions)
+    class_props = _class_props()
+    # Identical property tuples are shared across templates
+    prop_tuples: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+    
+    for tpl_idx, template in enumerate(templates):
+        if not isinstance(template, list) or len(template) < 2:
+            continue
+        
+        class_def_idx = template[0]
+        if not (0 <= class_def_idx < n_cds):
+            continue
+            
+        class_def = cds[class_def_idx]
+        if not isinstance(class_def, list) or len(class_def) < 2:
+            continue
+            
+        class_name = class_def[0]
+        if isinstance(class_name, str):
+            class_name = class_def[0] = sys.intern(class_name)
+        prop_indices = class_def[1:] if len(class_def) > 1 else []
+        
+        # Map property indices to names
+        names: List[str] = []
+        for prop_idx in prop_indices:
+            if isinstance(prop_idx, int):
+                if prop_idx < 0:  # Negative indices reference property_names
+                    ref_idx = (-prop_idx) - 1
+                    if 0 <= ref_idx < n_pn:
+                        names.append(pn[ref_idx])
+                else:  # Positive indices might be direct references
+                    names.append(_prop_fallback_name(prop_idx))
+            else:
+                # Handle non-integer indices safely
+                names.append(f"unknown_{prop_idx}")
+        
+        # Use reference data if available
+        ref_props = class_props.get(class_name)
+        if ref_props and len(ref_props) >= len(names):
+            properties = ref_props[:len(names)]
+        else:
+            properties = tuple(names)
+        properties = prop_tuples.setdefault(properties, properties)
+        
+        extra_data = template[2:]
+        try:
+            extra_data = array('i', extra_data)
+        except (TypeError, OverflowError):
+            pass  # non-int extras: keep the list slice
+        
+        class_templates[tpl_idx] = ClassTemplateInfo(
+            tpl_index=tpl_idx,
+            class_name=class_name,
+            properties=properties,
+            extra_data=extra_data
+        )
+    
+    return class_templates
+
+@dataclass(slots=True)
 class PackFormatInfo:
     """Complete pack format metadata and index resolution system.
     
@@ -398,7 +804,8 @@ class PackFormatInfo:
         property_names: Global property name lookup table
         class_definitions: Raw class definition data from pack
         templates: Raw template data from pack
-        class_templates: Resolved template index → ClassTemplateInfo mapping
+        class_templates: ClassTemplateInfo per template index (None if unresolved)
+        node_table: Columnar transform/size/color data for all packed node rows
         
     The key insight: This class resolves the indirection:
         template_index → class_definition → property_indices → property_names
@@ -408,7 +815,8 @@ class PackFormatInfo:
     property_names: List[str]
     class_definitions: List[Any]
     templates: List[Any]
-    class_templates: Dict[int, ClassTemplateInfo] = field(default_factory=dict)
+    class_templates: List[Optional[ClassTemplateInfo]] = field(default_factory=list)
+    node_table: Optional[NodeTable] = None
     
     def build_class_index(self) -> None:
         """Build comprehensive class index mapping from pack data.
@@ -417,57 +825,19 @@ class PackFormatInfo:
         1. Iterates through templates array
         2. Maps each template to its class definition
         3. Resolves property indices to actual property names
-        4. Populates class_templates dictionary
+        4. Populates the class_templates list
         
         The result enables direct lookup: template_index → class info + properties
         """
-        prop_ref = {i: name for i, name in enumerate(self.property_names)}
-        
-        for tpl_idx, template in enumerate(self.templates):
-            if not isinstance(template, list) or len(template) < 2:
-                continue
-            
-            class_def_idx = template[0]
-            if not (0 <= class_def_idx < len(self.class_definitions)):
-                continue
-                
-            class_def = self.class_definitions[class_def_idx]
-            if not isinstance(class_def, list) or len(class_def) < 2:
-                continue
-                
-            class_name = class_def[0]
-            prop_indices = class_def[1:] if len(class_def) > 1 else []
-            
-            # Map property indices to names
-            properties = []
-            for prop_idx in prop_indices:
-                if isinstance(prop_idx, int):
-                    if prop_idx < 0:  # Negative indices reference property_names
-                        ref_idx = (-prop_idx) - 1
-                        if 0 <= ref_idx < len(self.property_names):
-                            properties.append(self.property_names[ref_idx])
-                    else:  # Positive indices might be direct references
-                        properties.append(f"prop_{prop_idx}")
-                else:
-                    # Handle non-integer indices safely
-                    properties.append(f"unknown_{prop_idx}")
-            
-            # Use reference data if available
-            if class_name in CLASS_INDEX_REFERENCE:
-                ref_props = CLASS_INDEX_REFERENCE[class_name].get("props", [])
-                if not ref_props:
-                    ref_props = CLASS_INDEX_REFERENCE[class_name].get("common_props", [])
-                if ref_props and len(ref_props) >= len(properties):
-                    properties = ref_props[:len(properties)]
-            
-            extra_data = template[2:] if len(template) > 2 else []
-            
-            self.class_templates[tpl_idx] = ClassTemplateInfo(
-                tpl_index=tpl_idx,
-                class_name=class_name,
-                properties=properties,
-                extra_data=extra_data
-            )
+        self.class_templates = _build_class_templates(
+            self.templates, self.class_definitions, self.property_names)
+
+    def template(self, tpl_idx: Any) -> Optional[ClassTemplateInfo]:
+        """Return the resolved template at ``tpl_idx``, or None."""
+        tpls = self.class_templates
+        if type(tpl_idx) is int and 0 <= tpl_idx < len(tpls):
+            return tpls[tpl_idx]
+        return None
     
     @classmethod
     def from_pack_data(cls, data: List[Any]) -> "PackFormatInfo":
@@ -478,32 +848,36 @@ class PackFormatInfo:
         format_info = cls(
             format_version=data[0],
             uuids_count=len(data[1]) if isinstance(data[1], list) else 0,
-            property_names=data[2] if isinstance(data[2], list) else [],
+            # Interned so every component dict keyed on these names shares one object
+            property_names=[sys.intern(s) if isinstance(s, str) else s for s in data[2]]
+                           if isinstance(data[2], list) else [],
             class_definitions=data[3] if isinstance(data[3], list) else [],
             templates=data[4] if isinstance(data[4], list) else []
         )
         
         format_info.build_class_index()
+        format_info.node_table = NodeTable.from_blocks(_node_blocks(data[5:]))
         return format_info
 
 # ─────────────────────────────── util formatters ──────────────────────────────
 def _num(x: Any) -> str:
+    if type(x) is int:
+        return str(x)
     try:
-        return ("{:.6g}".format(float(x))).rstrip("0").rstrip(".")
+        # 'g' already drops trailing zeros and a bare trailing '.'
+        return format(float(x), ".6g")
     except Exception:
         return "-"
 
 def _vec(tab: List[Any], base: int) -> Tuple[str, str, str]:
     try:
-        return tuple(_num(tab[base + k]) for k in range(3))
+        return (_num(tab[base]), _num(tab[base + 1]), _num(tab[base + 2]))
     except Exception:
         return ("-", "-", "-")
 
 # ───────────────────────────── ComponentDecoder Engine ───────────────────────────────
 
-from abc import ABC, abstractmethod
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AssetReference:
     """Represents a reference to an asset in the pack format."""
     asset_id: int
@@ -512,17 +886,29 @@ class AssetReference:
     def __str__(self) -> str:
         return f"Asset({self.asset_id}, {self.asset_type})"
 
-@dataclass
+@dataclass(slots=True)
 class DecodedComponent:
     """Base class for all decoded components."""
     component_type: str
     template_index: int
     properties: Dict[str, Any] = field(default_factory=dict)
-    asset_refs: Set[AssetReference] = field(default_factory=set)
+    # Referenced asset id -> its first recorded type, in the order added. Ids
+    # index this pack's asset table, so types are kept per component.
+    asset_types: Dict[int, str] = field(default_factory=dict)
     
     def add_asset_ref(self, asset_id: int, asset_type: str = "unknown"):
         """Add an asset reference to this component."""
-        self.asset_refs.add(AssetReference(asset_id, asset_type))
+        self.asset_types.setdefault(asset_id, asset_type)
+
+    @property
+    def asset_ids(self) -> List[int]:
+        """Referenced asset ids, in the order they were added."""
+        return list(self.asset_types)
+
+    @property
+    def asset_refs(self) -> Set[AssetReference]:
+        """Asset references as AssetReference objects (built on access)."""
+        return {AssetReference(a, t) for a, t in self.asset_types.items()}
     
     def __str__(self) -> str:
         """String representation showing component type and key properties."""
@@ -530,7 +916,7 @@ class DecodedComponent:
         if self.properties:
             # Show up to 3 most relevant properties
             key_props = []
-            for key, value in list(self.properties.items())[:3]:
+            for key, value in islice(self.properties.items(), 3):
                 if value is not None and value != "" and value != []:
                     if isinstance(value, str):
                         key_props.append(f"{key}='{value}'")
@@ -538,7 +924,7 @@ class DecodedComponent:
                         key_props.append(f"{key}={value}")
             props_str = f"({', '.join(key_props)})" if key_props else ""
         
-        asset_str = f" [assets: {len(self.asset_refs)}]" if self.asset_refs else ""
+        asset_str = f" [assets: {len(self.asset_types)}]" if self.asset_types else ""
         return f"{self.component_type}{props_str}{asset_str}"
 
 @dataclass 
@@ -565,12 +951,37 @@ class DecodeHelper:
     
     def decode_value_type(self, value: Any) -> Any:
         """Decode value types using the provided decoder."""
-        if self.value_type_decoder and isinstance(value, list) and ValueTypeDeserializer.is_value_array(value):
-            return ValueTypeDeserializer.decode(value)
+        # Inlined ValueTypeDeserializer.is_value_array (called once per property)
+        if self.value_type_decoder and type(value) is list and value:
+            t0 = value[0]
+            if type(t0) is int and 0 <= t0 <= 7:
+                return ValueTypeDeserializer.decode(value)
         return value
 
+# Registry mapping component types to their decoders. Populated automatically
+# by every ``ComponentDecoder`` subclass that sets a ``component_type`` string.
+DECODERS: Dict[str, Type["ComponentDecoder"]] = {}
+
 class ComponentDecoder(ABC):
-    """Abstract base class for component decoders."""
+    """Abstract base class for component decoders.
+
+    Subclasses that declare the component class they decode as a plain
+    class attribute register themselves in :data:`DECODERS`::
+
+        class LabelDecoder(ComponentDecoder):
+            component_type: ClassVar[str] = "cc.Label"
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        component_type = cls.__dict__.get("component_type")
+        if isinstance(component_type, str):
+            cls.component_type = component_type = sys.intern(component_type)
+            DECODERS[component_type] = cls
+
+    def __init__(self) -> None:
+        # Compiled schemas by properties tuple (see _compile_schema)
+        self._schemas: Dict[Tuple[str, ...], Tuple[Tuple[str, Optional[str]], ...]] = {}
     
     @abstractmethod
     def decode(self, raw_row: List[Any], prop_names: List[str], helper: DecodeHelper) -> DecodedComponent:
@@ -583,20 +994,73 @@ class ComponentDecoder(ABC):
         """Return the component type this decoder handles."""
         pass
 
+    def _compile_schema(self, prop_names: Sequence[str],
+                        prop_mapping: Dict[str, str]) -> Tuple[Tuple[str, Optional[str]], ...]:
+        """Pair each property slot with its mapped attribute name (or None).
+
+        Resolved once per property-name table and cached on the decoder, so
+        the per-row loop does a tuple index instead of a dict probe per
+        property. Only immutable tuples are cached; template tables are
+        interned tuples (see _build_class_templates), so the cache holds one
+        entry per distinct table. Lists are compiled on every call.
+        """
+        if type(prop_names) is not tuple:
+            return tuple((name, prop_mapping.get(name)) for name in prop_names)
+        schema = self._schemas.get(prop_names)
+        if schema is None:
+            schema = self._schemas[prop_names] = tuple(
+                (name, prop_mapping.get(name)) for name in prop_names)
+        return schema
+
 # ───────────────────────────── Specific Decoders ───────────────────────────────
 
-@dataclass
+class KeyframeColumns(NamedTuple):
+    """One animated property as parallel frame/value columns.
+
+    Numeric columns are packed into ``array('d')``; columns holding
+    non-numeric values (vectors, colors) stay plain lists.
+    """
+    frames: Sequence[Any]
+    values: Sequence[Any]
+
+    def as_dict_list(self) -> List[Dict[str, Any]]:
+        """Keyframes in the ``[{"time", "value"}, ...]`` row layout."""
+        return [{"time": f, "value": v} for f, v in zip(self.frames, self.values)]
+
+@dataclass(slots=True)
 class AnimationClip:
-    """Represents an animation clip with keyframes."""
+    """Represents an animation clip with keyframes.
+
+    ``curves[node][prop]`` is a :class:`KeyframeColumns` for uniform
+    keyframe lists, or the keyframe list itself when entries are irregular.
+    """
     name: str
     duration: float
-    curves: Dict[str, Dict[str, List[Any]]] = field(default_factory=dict)
+    curves: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     wrap_mode: str = "normal"
     
     def __str__(self) -> str:
         return f"AnimClip('{self.name}', {self.duration}s, {len(self.curves)} curves)"
 
-@dataclass
+    def curves_as_dicts(self) -> Dict[str, Dict[str, List[Any]]]:
+        """Curves with every track expanded to the keyframe-dict row layout."""
+        return {
+            node: {prop: (track.as_dict_list() if isinstance(track, KeyframeColumns) else track)
+                   for prop, track in props.items()}
+            for node, props in self.curves.items()
+        }
+
+@dataclass(slots=True)
+class EmbeddedClip:
+    """Raw embedded animation clip as registered in ``CocosBundle.embedded_animations``."""
+    name: str
+    duration: Any
+    wrap_mode: Any
+    sample_rate: Any
+    curves: Any
+    class_name: str = "cc.AnimationClip"
+
+@dataclass(slots=True)
 class AnimationComponent(DecodedComponent):
     """Decoded cc.Animation component."""
     play_on_load: bool = False
@@ -630,7 +1094,12 @@ class AnimationComponent(DecodedComponent):
 
         return f"Animation({', '.join(parts)})"
 
-@dataclass
+# cc.Widget alignFlags bits, in display order.
+_WIDGET_FLAGS: Tuple[Tuple[int, str], ...] = (
+    (1, "LEFT"), (2, "RIGHT"), (4, "TOP"), (8, "BOTTOM"), (16, "H_CENTER"), (32, "V_CENTER"),
+)
+
+@dataclass(slots=True)
 class WidgetComponent(DecodedComponent):
     """Decoded cc.Widget component."""
     align_flags: int = 0
@@ -646,13 +1115,7 @@ class WidgetComponent(DecodedComponent):
         """Enhanced string representation for Widget components."""
         # Decode alignment flags
         flags = self.align_flags
-        alignments = []
-        if flags & 1: alignments.append("LEFT")
-        if flags & 2: alignments.append("RIGHT")
-        if flags & 4: alignments.append("TOP")
-        if flags & 8: alignments.append("BOTTOM")
-        if flags & 16: alignments.append("H_CENTER")
-        if flags & 32: alignments.append("V_CENTER")
+        alignments = [name for bit, name in _WIDGET_FLAGS if flags & bit]
         
         align_str = "|".join(alignments) if alignments else "NONE"
         
@@ -664,7 +1127,11 @@ class WidgetComponent(DecodedComponent):
         
         return f"Widget({', '.join(parts)})"
 
-@dataclass
+# cc.Label horizontalAlign / verticalAlign enum names, indexed by value.
+_LABEL_H_ALIGN: Tuple[str, ...] = ("Left", "Center", "Right")
+_LABEL_V_ALIGN: Tuple[str, ...] = ("Top", "Middle", "Bottom")
+
+@dataclass(slots=True)
 class LabelComponent(DecodedComponent):
     """Decoded cc.Label component."""
     text: str = ""
@@ -688,11 +1155,10 @@ class LabelComponent(DecodedComponent):
             v_align_val = self.properties.get('_N$verticalAlign', 0)
             
             # Map alignment values
-            h_align_map = {0: "Left", 1: "Center", 2: "Right"}
-            v_align_map = {0: "Top", 1: "Middle", 2: "Bottom"}
-            
-            h_align = h_align_map.get(h_align_val, "Left")
-            v_align = v_align_map.get(v_align_val, "Top")
+            if isinstance(h_align_val, int) and 0 <= h_align_val < 3:
+                h_align = _LABEL_H_ALIGN[h_align_val]
+            if isinstance(v_align_val, int) and 0 <= v_align_val < 3:
+                v_align = _LABEL_V_ALIGN[v_align_val]
         
         # Build color string
         # Prefer explicit color field, fall back to stored properties
@@ -714,10 +1180,15 @@ class LabelComponent(DecodedComponent):
 
 class AnimationDecoder(ComponentDecoder):
     """Decoder for cc.Animation components with enhanced clip parsing."""
+
+    # Animation properties mapping
+    _PROP_MAPPING: Dict[str, str] = {
+        "playOnLoad": "play_on_load",
+        "_clips": "clips",
+        "_defaultClip": "default_clip"
+    }
     
-    @property
-    def component_type(self) -> str:
-        return "cc.Animation"
+    component_type: ClassVar[str] = "cc.Animation"
     
     def decode(self, raw_row: List[Any], prop_names: List[str], helper: DecodeHelper) -> AnimationComponent:
         component = AnimationComponent(
@@ -725,20 +1196,18 @@ class AnimationDecoder(ComponentDecoder):
             template_index=raw_row[0] if raw_row else -1
         )
         
-        # Animation properties mapping
-        prop_mapping = {
-            "playOnLoad": "play_on_load",
-            "_clips": "clips",
-            "_defaultClip": "default_clip"
-        }
-        
         # Decode properties from raw_row
-        for i, value in enumerate(raw_row[1:], 1):  # Skip template index
-            prop_name = prop_names[i-1] if i-1 < len(prop_names) else f"prop_{i-1}"
+        schema = self._compile_schema(prop_names, self._PROP_MAPPING)
+        n_schema = len(schema)
+        is_asset_ref, get_asset_type = helper.is_asset_reference, helper.get_asset_type
+        decode_value = helper.decode_value_type
+        add_asset_ref, properties = component.add_asset_ref, component.properties
+        for i, value in enumerate(raw_row[1:]):  # Skip template index
+            prop_name, attr_name = schema[i] if i < n_schema else (_prop_fallback_name(i), None)
+            is_ref = is_asset_ref(value)
             
             # Map to component attribute if known
-            if prop_name in prop_mapping:
-                attr_name = prop_mapping[prop_name]
+            if attr_name is not None:
                 if attr_name == "play_on_load" and isinstance(value, bool):
                     component.play_on_load = value
                 elif attr_name == "clips" and isinstance(value, list):
@@ -747,39 +1216,36 @@ class AnimationDecoder(ComponentDecoder):
                 elif attr_name == "default_clip" and isinstance(value, (str, int)):
                     if isinstance(value, str):
                         component.default_clip = value
-                    elif helper.is_asset_reference(value):
-                        component.add_asset_ref(value, "animation_clip")
+                    elif is_ref:
+                        add_asset_ref(value, "animation_clip")
             
             # Store all properties for completeness
-            component.properties[prop_name] = helper.decode_value_type(value)
+            properties[prop_name] = decode_value(value)
             
             # Check for asset references
-            if helper.is_asset_reference(value):
-                asset_type = helper.get_asset_type(value)
-                component.add_asset_ref(value, asset_type)
+            if is_ref:
+                add_asset_ref(value, get_asset_type(value))
         
         return component
     
     def _parse_animation_clips(self, clips_data: List[Any], helper: DecodeHelper) -> List[AnimationClip]:
         """Parse animation clips from various formats with comprehensive curve extraction."""
         clips = []
+        dispatch = _CLIP_DISPATCH
         
         for clip_data in clips_data:
-            if isinstance(clip_data, dict):
-                # Direct clip object with name, duration, curves
-                clip = self._parse_clip_object(clip_data)
+            # Packed JSON never yields subclasses, so dispatch on exact type
+            handler = dispatch.get(type(clip_data))
+            if handler is not None:
+                # Clip object (dict) or embedded clip data (list)
+                clip = handler(self, clip_data)
                 if clip:
                     clips.append(clip)
-            elif isinstance(clip_data, int) and helper.is_asset_reference(clip_data):
+            elif type(clip_data) is int and helper.is_asset_reference(clip_data):
                 # Asset reference to external clip
                 clip_name = f"clip_{clip_data}"
                 clips.append(AnimationClip(name=clip_name, duration=0.0))
                 helper.asset_registry[clip_data] = {"class": "cc.AnimationClip", "name": clip_name}
-            elif isinstance(clip_data, list) and len(clip_data) >= 2:
-                # Embedded clip data - parse the complete format
-                clip = self._parse_embedded_clip_data(clip_data)
-                if clip:
-                    clips.append(clip)
         
         return clips
     
@@ -797,7 +1263,7 @@ class AnimationDecoder(ComponentDecoder):
         clip = AnimationClip(name=clip_name, duration=float(duration), wrap_mode=str(wrap_mode))
         
         # Parse curve data if present (usually at index 5)
-        if len(clip_data) > 5 and isinstance(clip_data[5], dict):
+        if len(clip_data) > 5 and type(clip_data[5]) is dict:
             clip.curves = self._parse_curves(clip_data[5])
         
         return clip
@@ -818,7 +1284,7 @@ class AnimationDecoder(ComponentDecoder):
         
         return clip
     
-    def _parse_curves(self, curves_data: Dict[str, Any]) -> Dict[str, Dict[str, List[Any]]]:
+    def _parse_curves(self, curves_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """Parse animation curves for position, rotation, etc."""
         curves = {}
         
@@ -836,6 +1302,12 @@ class AnimationDecoder(ComponentDecoder):
                 for prop_name, keyframes in props.items():
                     if isinstance(keyframes, list):
                         # Parse keyframe data - each keyframe has frame and value
+                        columns = _extract_kf_columns(keyframes)
+                        if columns is not None:
+                            curves[node_name][prop_name] = KeyframeColumns(
+                                _pack_column(columns[0]), _pack_column(columns[1]))
+                            continue
+                        # Mixed or irregular keyframes: convert one at a time
                         parsed_keyframes = []
                         for kf in keyframes:
                             if isinstance(kf, dict) and "frame" in kf and "value" in kf:
@@ -849,12 +1321,81 @@ class AnimationDecoder(ComponentDecoder):
         
         return curves
 
+def _extract_kf_columns(keyframes: List[Any]) -> Optional[Tuple[List[Any], List[Any]]]:
+    """Split uniform ``{"frame", "value"}`` keyframes into frame and value columns.
+
+    Returns None if any keyframe has another shape, so the caller can fall
+    back to per-keyframe conversion.
+    """
+    try:
+        return [kf["frame"] for kf in keyframes], [kf["value"] for kf in keyframes]
+    except (TypeError, KeyError, IndexError):
+        return None
+
+def _pack_column(col: List[Any]) -> Sequence[Any]:
+    """Pack an all-numeric keyframe column into array('d'); else keep the list."""
+    try:
+        return array('d', col)
+    except TypeError:
+        return col
+
+# Clip entry type → AnimationDecoder parser (called unbound with the decoder).
+# Embedded lists shorter than 5 items are rejected by the parser itself.
+_CLIP_DISPATCH: Dict[type, Callable[[AnimationDecoder, Any], Optional[AnimationClip]]] = {
+    dict: AnimationDecoder._parse_clip_object,
+    list: AnimationDecoder._parse_embedded_clip_data,
+}
+
+def _round_kf_value(v: Any, ndigits: int) -> Any:
+    """Round a float, or the floats inside a list/tuple value (vectors, colors)."""
+    t = type(v)
+    if t is float:
+        return round(v, ndigits)
+    if t is list or t is tuple:
+        return [round(x, ndigits) if type(x) is float else x for x in v]
+    return v
+
+def _round_kf(kf: Any, ndigits: int) -> Any:
+    if type(kf) is dict:
+        return {k: _round_kf_value(v, ndigits) for k, v in kf.items()}
+    return kf
+
+def serialize_curves(clip: AnimationClip, path: Path | str, *,
+                     compresslevel: int = 1, ndigits: Optional[int] = None) -> None:
+    """Write ``clip.curves`` as gzip-compressed JSON.
+
+    Keyframe JSON is dominated by repeated keys, so even the fastest gzip
+    level shrinks it several times over.
+
+    Args:
+        clip: Clip whose curves to write (in the keyframe-dict row layout)
+        path: Output file, conventionally ``*.json.gz``
+        compresslevel: gzip level; 1 favours speed over ratio
+        ndigits: Round float times/values to this many digits, if given
+    """
+    curves = clip.curves_as_dicts()
+    if ndigits is not None:
+        curves = {node: {prop: [_round_kf(kf, ndigits) for kf in track] for prop, track in props.items()}
+                  for node, props in curves.items()}
+    payload = _json.dumps(curves)
+    if isinstance(payload, str):  # stdlib json returns str, orjson bytes
+        payload = payload.encode("utf8")
+    with gzip.open(path, "wb", compresslevel=compresslevel) as fh:
+        fh.write(payload)
+
 class WidgetDecoder(ComponentDecoder):
     """Decoder for cc.Widget components."""
+
+    # Widget properties mapping
+    _PROP_MAPPING: Dict[str, str] = {
+        "_alignFlags": "align_flags",
+        "_left": "left",
+        "_right": "right",
+        "_top": "top",
+        "_bottom": "bottom"
+    }
     
-    @property
-    def component_type(self) -> str:
-        return "cc.Widget"
+    component_type: ClassVar[str] = "cc.Widget"
     
     def decode(self, raw_row: List[Any], prop_names: List[str], helper: DecodeHelper) -> WidgetComponent:
         component = WidgetComponent(
@@ -862,43 +1403,52 @@ class WidgetDecoder(ComponentDecoder):
             template_index=raw_row[0] if raw_row else -1
         )
         
-        # Widget properties mapping
-        prop_mapping = {
-            "_alignFlags": "align_flags",
-            "_left": "left",
-            "_right": "right",
-            "_top": "top",
-            "_bottom": "bottom"
-        }
-        
         # Decode properties from raw_row
-        for i, value in enumerate(raw_row[1:], 1):  # Skip template index
-            prop_name = prop_names[i-1] if i-1 < len(prop_names) else f"prop_{i-1}"
+        schema = self._compile_schema(prop_names, self._PROP_MAPPING)
+        n_schema = len(schema)
+        is_asset_ref, get_asset_type = helper.is_asset_reference, helper.get_asset_type
+        decode_value = helper.decode_value_type
+        add_asset_ref, properties = component.add_asset_ref, component.properties
+        for i, value in enumerate(raw_row[1:]):  # Skip template index
+            prop_name, attr_name = schema[i] if i < n_schema else (_prop_fallback_name(i), None)
+            is_ref = is_asset_ref(value)
             
             # Map to component attribute if known
-            if prop_name in prop_mapping:
-                attr_name = prop_mapping[prop_name]
-                if attr_name == "align_flags" and isinstance(value, int):
-                    component.align_flags = value
-                elif attr_name in ["left", "right", "top", "bottom"] and isinstance(value, (int, float)):
-                    setattr(component, attr_name, float(value))
+            if attr_name is not None:
+                if attr_name == "align_flags":
+                    if isinstance(value, int):
+                        component.align_flags = value
+                elif isinstance(value, (int, float)):
+                    if attr_name == "left":
+                        component.left = float(value)
+                    elif attr_name == "right":
+                        component.right = float(value)
+                    elif attr_name == "top":
+                        component.top = float(value)
+                    elif attr_name == "bottom":
+                        component.bottom = float(value)
             
             # Store all properties for completeness
-            component.properties[prop_name] = helper.decode_value_type(value)
+            properties[prop_name] = decode_value(value)
             
             # Check for asset references
-            if helper.is_asset_reference(value):
-                asset_type = helper.get_asset_type(value)
-                component.add_asset_ref(value, asset_type)
+            if is_ref:
+                add_asset_ref(value, get_asset_type(value))
         
         return component
 
 class LabelDecoder(ComponentDecoder):
     """Decoder for cc.Label components."""
+
+    # Common Label properties mapping
+    _PROP_MAPPING: Dict[str, str] = {
+        "_string": "text",
+        "_fontSize": "font_size", 
+        "_N$file": "font_asset",
+        "_N$horizontalAlign": "alignment"
+    }
     
-    @property
-    def component_type(self) -> str:
-        return "cc.Label"
+    component_type: ClassVar[str] = "cc.Label"
     
     def decode(self, raw_row: List[Any], prop_names: List[str], helper: DecodeHelper) -> LabelComponent:
         component = LabelComponent(
@@ -906,32 +1456,29 @@ class LabelDecoder(ComponentDecoder):
             template_index=raw_row[0] if raw_row else -1
         )
         
-        # Common Label properties mapping
-        prop_mapping = {
-            "_string": "text",
-            "_fontSize": "font_size", 
-            "_N$file": "font_asset",
-            "_N$horizontalAlign": "alignment"
-        }
-        
                 # Try to extract text from various positions if property mapping fails
         text_found = False
         
         # Decode properties from raw_row
-        for i, value in enumerate(raw_row[1:], 1):  # Skip template index
-            prop_name = prop_names[i-1] if i-1 < len(prop_names) else f"prop_{i-1}"
+        schema = self._compile_schema(prop_names, self._PROP_MAPPING)
+        n_schema = len(schema)
+        is_asset_ref, get_asset_type = helper.is_asset_reference, helper.get_asset_type
+        decode_value = helper.decode_value_type
+        add_asset_ref, properties = component.add_asset_ref, component.properties
+        for i, value in enumerate(raw_row[1:]):  # Skip template index
+            prop_name, attr_name = schema[i] if i < n_schema else (_prop_fallback_name(i), None)
+            is_ref = is_asset_ref(value)
             
             # Map to component attribute if known
-            if prop_name in prop_mapping:
-                attr_name = prop_mapping[prop_name]
+            if attr_name is not None:
                 if attr_name == "text" and isinstance(value, str):
                     component.text = value
                     text_found = True
                 elif attr_name == "font_size" and isinstance(value, (int, float)):
                     component.font_size = int(value)
-                elif attr_name == "font_asset" and helper.is_asset_reference(value):
+                elif attr_name == "font_asset" and is_ref:
                     component.font_asset = value
-                    component.add_asset_ref(value, "font")
+                    add_asset_ref(value, "font")
                 elif attr_name == "alignment":
                     component.alignment = self._decode_alignment(value)
             
@@ -941,12 +1488,11 @@ class LabelDecoder(ComponentDecoder):
                 text_found = True
             
             # Store all properties for completeness
-            component.properties[prop_name] = helper.decode_value_type(value)
+            properties[prop_name] = decode_value(value)
             
             # Check for asset references
-            if helper.is_asset_reference(value):
-                asset_type = helper.get_asset_type(value)
-                component.add_asset_ref(value, asset_type)
+            if is_ref:
+                add_asset_ref(value, get_asset_type(value))
         
         return component
     
@@ -957,13 +1503,27 @@ class LabelDecoder(ComponentDecoder):
             return alignment_map.get(value, "left")
         return str(value) if value else "left"
 
-@dataclass
+@dataclass(slots=True)
+class SpriteFrame:
+    """Sprite-frame metadata found in pack data (values of ``CocosBundle.sprite_frames``)."""
+    name: str
+    rect: Any
+    original_size: Any
+    offset: Any
+    cap_insets: Any
+    width: Any = 0
+    height: Any = 0
+
+@dataclass(slots=True)
 class SpriteComponent(DecodedComponent):
     """Decoded cc.Sprite component."""
     sprite_frame: Optional[int] = None
     size_mode: str = "trimmed"
     sprite_type: str = "simple"
     fill_range: float = 1.0
+    # Resolved sprite-frame name/metadata, filled in by TabRow.from_raw
+    _resolved_frame_name: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _resolved_frame_data: Optional[SpriteFrame] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         self.component_type = "cc.Sprite"
@@ -976,13 +1536,13 @@ class SpriteComponent(DecodedComponent):
         sprite_frame_display = "SpriteFrame#?"
 
         # Check if resolved frame information was set by TabRow.from_raw
-        if hasattr(self, '_resolved_frame_name') and self._resolved_frame_name:
-            frame_name = self._resolved_frame_name
+        frame_name = self._resolved_frame_name
+        if frame_name:
             sprite_frame_display = f'"{frame_name}"'
-            if hasattr(self, '_resolved_frame_data') and self._resolved_frame_data:
-                frame_data = self._resolved_frame_data
-                width = frame_data.get('width', 0)
-                height = frame_data.get('height', 0)
+            frame_data = self._resolved_frame_data
+            if frame_data:
+                width = frame_data.width
+                height = frame_data.height
                 sprite_frame_display += f' ({width}×{height})'
         elif self.sprite_frame:
             # Fallback: show asset reference
@@ -997,7 +1557,7 @@ class SpriteComponent(DecodedComponent):
         
         return f"<Sprite {' '.join(parts)}>"
 
-@dataclass
+@dataclass(slots=True)
 class ButtonComponent(DecodedComponent):
     """Decoded cc.Button component."""
     transition_type: str = "none"
@@ -1023,15 +1583,21 @@ class ButtonComponent(DecodedComponent):
         if not parts:
             parts.append("default")
         
-        asset_str = f" [assets: {len(self.asset_refs)}]" if self.asset_refs else ""
+        asset_str = f" [assets: {len(self.asset_types)}]" if self.asset_types else ""
         return f"{self.component_type}({', '.join(parts)}){asset_str}"
 
 class SpriteDecoder(ComponentDecoder):
     """Decoder for cc.Sprite components."""
+
+    # Common Sprite properties mapping
+    _PROP_MAPPING: Dict[str, str] = {
+        "_spriteFrame": "sprite_frame",
+        "_sizeMode": "size_mode",
+        "_type": "sprite_type",
+        "_fillRange": "fill_range"
+    }
     
-    @property  
-    def component_type(self) -> str:
-        return "cc.Sprite"
+    component_type: ClassVar[str] = "cc.Sprite"
     
     def decode(self, raw_row: List[Any], prop_names: List[str], helper: DecodeHelper) -> SpriteComponent:
         component = SpriteComponent(
@@ -1039,24 +1605,21 @@ class SpriteDecoder(ComponentDecoder):
             template_index=raw_row[0] if raw_row else -1
         )
         
-        # Common Sprite properties mapping
-        prop_mapping = {
-            "_spriteFrame": "sprite_frame",
-            "_sizeMode": "size_mode",
-            "_type": "sprite_type",
-            "_fillRange": "fill_range"
-        }
-        
         # Decode properties from raw_row
-        for i, value in enumerate(raw_row[1:], 1):  # Skip template index
-            prop_name = prop_names[i-1] if i-1 < len(prop_names) else f"prop_{i-1}"
+        schema = self._compile_schema(prop_names, self._PROP_MAPPING)
+        n_schema = len(schema)
+        is_asset_ref, get_asset_type = helper.is_asset_reference, helper.get_asset_type
+        decode_value = helper.decode_value_type
+        add_asset_ref, properties = component.add_asset_ref, component.properties
+        for i, value in enumerate(raw_row[1:]):  # Skip template index
+            prop_name, attr_name = schema[i] if i < n_schema else (_prop_fallback_name(i), None)
+            is_ref = is_asset_ref(value)
             
             # Map to component attribute if known
-            if prop_name in prop_mapping:
-                attr_name = prop_mapping[prop_name]
-                if attr_name == "sprite_frame" and helper.is_asset_reference(value):
+            if attr_name is not None:
+                if attr_name == "sprite_frame" and is_ref:
                     component.sprite_frame = value
-                    component.add_asset_ref(value, "sprite_frame")
+                    add_asset_ref(value, "sprite_frame")
                 elif attr_name == "size_mode" and isinstance(value, int):
                     component.size_mode = self._decode_size_mode(value)
                 elif attr_name == "sprite_type" and isinstance(value, int):
@@ -1065,12 +1628,11 @@ class SpriteDecoder(ComponentDecoder):
                     component.fill_range = float(value)
             
             # Store all properties for completeness
-            component.properties[prop_name] = helper.decode_value_type(value)
+            properties[prop_name] = decode_value(value)
             
             # Check for asset references
-            if helper.is_asset_reference(value):
-                asset_type = helper.get_asset_type(value)
-                component.add_asset_ref(value, asset_type)
+            if is_ref:
+                add_asset_ref(value, get_asset_type(value))
         
         return component
     
@@ -1090,6 +1652,7 @@ class FallbackDecoder(ComponentDecoder):
     """Fallback decoder for unknown component types."""
     
     def __init__(self, component_type: str):
+        super().__init__()
         self._component_type = component_type
     
     @property
@@ -1106,51 +1669,46 @@ class FallbackDecoder(ComponentDecoder):
             template_index=raw_row[0] if raw_row else -1
         )
         
+        is_asset_ref, get_asset_type = helper.is_asset_reference, helper.get_asset_type
+        decode_value = helper.decode_value_type
+        add_asset_ref, properties = component.add_asset_ref, component.properties
+        stack: List[Any] = []
+        
         # Process all properties with type detection
         for i, value in enumerate(raw_row[1:], 1):  # Skip template index
-            prop_name = prop_names[i-1] if i-1 < len(prop_names) else f"prop_{i-1}"
+            prop_name = prop_names[i-1] if i-1 < len(prop_names) else _prop_fallback_name(i-1)
             
             # Apply value type decoding
-            decoded_value = helper.decode_value_type(value)
-            component.properties[prop_name] = decoded_value
+            decoded_value = decode_value(value)
+            properties[prop_name] = decoded_value
             
             # Apply asset detection
-            if helper.is_asset_reference(value):
-                asset_type = helper.get_asset_type(value)
-                component.add_asset_ref(value, asset_type)
+            if is_asset_ref(value):
+                add_asset_ref(value, get_asset_type(value))
             
-            # Recursive asset detection for nested structures
-            self._detect_nested_assets(decoded_value, component, helper)
+            # Asset detection for nested structures: iterative depth-first
+            # walk, children pushed reversed so refs are found in source order.
+            # Scalars (the bulk of properties) never enter the walk.
+            t = type(decoded_value)
+            if t is list:
+                stack.extend(reversed(decoded_value))
+            elif t is dict:
+                stack.extend(reversed(decoded_value.values()))
+            else:
+                continue
+            while stack:
+                item = stack.pop()
+                t = type(item)
+                if t is list:
+                    stack.extend(reversed(item))
+                elif t is dict:
+                    stack.extend(reversed(item.values()))
+                elif is_asset_ref(item):
+                    add_asset_ref(item, get_asset_type(item))
         
         return component
-    
-    def _detect_nested_assets(self, value: Any, component: DecodedComponent, helper: DecodeHelper):
-        """Recursively detect asset references in nested structures."""
-        if isinstance(value, list):
-            for item in value:
-                if helper.is_asset_reference(item):
-                    asset_type = helper.get_asset_type(item)
-                    component.add_asset_ref(item, asset_type)
-                else:
-                    self._detect_nested_assets(item, component, helper)
-        elif isinstance(value, dict):
-            for item in value.values():
-                if helper.is_asset_reference(item):
-                    asset_type = helper.get_asset_type(item)
-                    component.add_asset_ref(item, asset_type)
-                else:
-                    self._detect_nested_assets(item, component, helper)
-
-# ───────────────────────────── Decoder Registry ───────────────────────────────
 
-# Registry mapping component types to their decoders
-DECODERS: Dict[str, Type[ComponentDecoder]] = {
-    "cc.Label": LabelDecoder,
-    "cc.Sprite": SpriteDecoder,
-    "cc.Animation": AnimationDecoder,
-    "cc.Widget": WidgetDecoder,
-    # Add more decoders here as needed
-}
+# ───────────────────────────── Decoder Engine ───────────────────────────────
 
 class ComponentDecoderEngine:
     """Main engine for decoding components using registered decoders.
@@ -1172,6 +1730,15 @@ class ComponentDecoderEngine:
         """
         self.decoders = decoders or DECODERS.copy()
         self._decoder_instances: Dict[str, ComponentDecoder] = {}
+        # template index → (class name, decoder), valid for one templates table
+        self._by_tpl: Dict[int, Tuple[str, ComponentDecoder]] = {}
+        self._by_tpl_source: Optional[List[Any]] = None
+        # template index → DecodeHelper built by TabRow.from_raw; its bundle
+        # context is fixed for one pack, so it is dropped with ``_by_tpl``
+        self.helpers: Dict[int, DecodeHelper] = {}
+        # component class → (is_asset_reference, get_asset_type) bound to the
+        # pack's asset registry, shared by that class's helpers
+        self.asset_fns: Dict[str, Tuple[Callable[[Any], bool], Callable[[int], str]]] = {}
     
     def register_decoder(self, component_type: str, decoder_class: Type[ComponentDecoder]):
         """Register a new decoder for a component type."""
@@ -1179,6 +1746,7 @@ class ComponentDecoderEngine:
         # Clear cached instance if it exists
         if component_type in self._decoder_instances:
             del self._decoder_instances[component_type]
+        self._by_tpl.clear()
     
     def get_decoder(self, component_type: str) -> ComponentDecoder:
         """Get decoder instance for a component type, creating fallback if needed."""
@@ -1190,6 +1758,29 @@ class ComponentDecoderEngine:
                 self._decoder_instances[component_type] = FallbackDecoder(component_type)
         
         return self._decoder_instances[component_type]
+
+    def get_decoder_by_tpl(self, comp_tpl: int, class_of: Callable[[int], str],
+                           templates: List[Any]) -> Tuple[str, ComponentDecoder]:
+        """Resolve a component template index to its class name and decoder.
+
+        Cached per template index, so repeated components skip both
+        ``class_of`` and the string-keyed :meth:`get_decoder` lookup. The
+        cache is dropped when called with a different templates table.
+
+        Returns:
+            ``(class_name, decoder)``; class name is "Unknown" for indices
+            outside ``templates``
+        """
+        if templates is not self._by_tpl_source:
+            self._by_tpl.clear()
+            self.helpers.clear()
+            self.asset_fns.clear()
+            self._by_tpl_source = templates
+        hit = self._by_tpl.get(comp_tpl)
+        if hit is None:
+            comp_cls = class_of(templates[comp_tpl][0]) if 0 <= comp_tpl < len(templates) else "Unknown"
+            hit = self._by_tpl[comp_tpl] = (comp_cls, self.get_decoder(comp_cls))
+        return hit
     
     def decode_component(self, 
                         component_type: str,
@@ -1207,7 +1798,7 @@ class ComponentDecoderEngine:
         return list(self.decoders.keys())
 
 # ───────────────────────────── component models ───────────────────────────────
-@dataclass
+@dataclass(slots=True)
 class Component:
     tpl: int
     cls: str
@@ -1215,28 +1806,38 @@ class Component:
     decoded_component: Optional[DecodedComponent] = None
     
     def __str__(self) -> str:
-        if self.decoded_component:
+        if self.decoded_component is not None:
             # Use the decoded component's enhanced __str__ method
             return str(self.decoded_component)
-        elif self.cls == "cc.Sprite":
-            # Fallback XML format for Sprite components without decoded_component
-            if self.decoded_component:
-                frame_display = getattr(self.decoded_component, '_resolved_frame_name', 'UNKNOWN')
-                if frame_display != 'UNKNOWN' and hasattr(self.decoded_component, '_resolved_frame_data'):
-                    frame_data = self.decoded_component._resolved_frame_data
-                    width = frame_data.get('width', 0)
-                    height = frame_data.get('height', 0)
-                    return f"<Sprite spriteFrame=\"{frame_display}\" ({width}×{height}) sizeMode=SIMPLE>"
-            return f"<Sprite spriteFrame=SpriteFrame#? sizeMode=SIMPLE>"
-        elif self.cls == "cc.Label" and hasattr(self, 'text'):
-            # Fallback for Label components
-            return f"<Label text='{getattr(self, 'text', '')}' fontSize=45 hAlign=Center vAlign=Middle color=rgba(255,255,255,255)>"
-        elif self.properties:
-            prop_strs = [f"{k}={v}" for k, v in self.properties.items() if v is not None]
-            return f"{self.cls}({', '.join(prop_strs[:3])}...)"  # Limit to first 3 props
+        fn = _COMPONENT_STR.get(self.cls)
+        return fn(self) if fn is not None else self._str_generic()
+
+    def _str_generic(self) -> str:
+        if self.properties:
+            # Only the first 3 non-None props are formatted
+            prop_strs = islice((f"{k}={v}" for k, v in self.properties.items() if v is not None), 3)
+            return f"{self.cls}({', '.join(prop_strs)}...)"
         return f"{self.cls}(tpl={self.tpl})"
 
+def _component_str_sprite(c: Component) -> str:
+    # Fallback XML format for Sprite components without decoded_component
+    return "<Sprite spriteFrame=SpriteFrame#? sizeMode=SIMPLE>"
+
+def _component_str_label(c: Component) -> str:
+    # Fallback for Label components
+    if hasattr(c, 'text'):
+        return f"<Label text='{c.text}' fontSize=45 hAlign=Center vAlign=Middle color=rgba(255,255,255,255)>"
+    return c._str_generic()
+
+# Class-specific fallback renderers for components without a decoded_component
+_COMPONENT_STR: Dict[str, Callable[[Component], str]] = {
+    "cc.Sprite": _component_str_sprite,
+    "cc.Label": _component_str_label,
+}
+
 class LabelComp(Component):
+    __slots__ = ("text", "font_tpl", "color_tpl")
+
     def __init__(self, tpl: int, cls: str, text: str, font_tpl: int | None, color_tpl: int | None):
         super().__init__(tpl, cls)
         self.text = text
@@ -1252,6 +1853,194 @@ class LabelComp(Component):
         parts.append("color=rgba(255,255,255,255)")
         return f"<Label {' '.join(parts)}>"
 
+# ──────────────────── decode context helpers (used by TabRow) ─────────────────────
+# Module-level so TabRow.from_raw binds them with functools.partial instead of
+# defining fresh closures for every component.
+
+def _get_enhanced_asset_type(asset_id: int, asset_registry: Dict[int, Any]) -> str:
+    if asset_id in asset_registry:
+        asset_info = asset_registry[asset_id]
+        if isinstance(asset_info, dict) and 'class' in asset_info:
+            return asset_info['class']
+    
+    return "unknown"
+
+def _resolve_sprite_frame_name(asset_id: int, sprite_frames: Optional[Dict[str, SpriteFrame]],
+                               node_name: Optional[str], smallest: Optional[str] = None,
+                               largest: Optional[str] = None) -> str:
+    # smallest/largest: precomputed narrowest/widest frame names (CocosBundle._index_sprite_frames)
+    # Try to match sprite frame by node name if asset_id doesn't match directly
+    current_node_name = node_name if node_name else None
+    node_lower = current_node_name.lower() if current_node_name else ""
+    
+    # Check if we have sprite frames registry
+    if sprite_frames:
+        # First try: match by node name
+        if current_node_name and current_node_name in sprite_frames:
+            frame_data = sprite_frames[current_node_name]
+            width = frame_data.width
+            height = frame_data.height
+            return f'"{current_node_name}" ({width}×{height})'
+        
+        # Second try: if there's only one or two sprite frames, use them by process of elimination
+        sprite_frame_names = list(sprite_frames.keys())
+        if len(sprite_frame_names) == 1:
+            frame_name = sprite_frame_names[0]
+            frame_data = sprite_frames[frame_name]
+            width = frame_data.width
+            height = frame_data.height
+            return f'"{frame_name}" ({width}×{height})'
+        elif len(sprite_frame_names) == 2:
+            # Use heuristics - white_loading is usually the small spinning loader, GameIcon is large
+            for frame_name in sprite_frame_names:
+                if current_node_name and frame_name.lower() in node_lower:
+                    frame_data = sprite_frames[frame_name]
+                    width = frame_data.width
+                    height = frame_data.height
+                    return f'"{frame_name}" ({width}×{height})'
+            
+            # Fallback: match by size - if node is white_loading, use smaller frame; if GameIcon, use larger
+            if current_node_name:
+                if 'white_loading' in node_lower:
+                    # Use the smaller sprite frame
+                    smaller_frame = smallest or min(sprite_frame_names, key=lambda f: sprite_frames[f].width)
+                    frame_data = sprite_frames[smaller_frame]
+                    width = frame_data.width
+                    height = frame_data.height
+                    return f'"{smaller_frame}" ({width}×{height})'
+                elif 'gameicon' in node_lower:
+                    # Use the larger sprite frame
+                    larger_frame = largest or max(sprite_frame_names, key=lambda f: sprite_frames[f].width)
+                    frame_data = sprite_frames[larger_frame]
+                    width = frame_data.width
+                    height = frame_data.height
+                    return f'"{larger_frame}" ({width}×{height})'
+    
+    return f"SpriteFrame#{asset_id}"
+
+def _enhanced_asset_detection(value: Any, asset_registry: Dict[int, Any], comp_cls: str) -> bool:
+    """Asset reference test used while decoding; liberal for sprite frames."""
+    if not isinstance(value, int):
+        return False
+    # Check if it's in our asset registry
+    if value in asset_registry:
+        return True
+    # For sprite components, be more liberal with asset detection
+    if comp_cls == "cc.Sprite":
+        return value != 0
+    # Standard detection for other components (plain comparisons, no abs())
+    return value > ASSET_REF_THRESHOLD or value < -ASSET_REF_THRESHOLD
+
+def _decode_color(val: Any) -> Optional[Color]:
+    """Decode a node/label colour from a value-type array, list, dict or packed int."""
+    if val is None:
+        return None
+    # Support value-type arrays, dicts or packed ints
+    if isinstance(val, list):
+        if ValueTypeDeserializer.is_value_array(val):
+            val = ValueTypeDeserializer.decode(val)
+            if isinstance(val, Color):
+                return val
+        n = len(val)
+        if n == 3 or n == 4:
+            # Unpack once; four inline isinstance checks beat a generator for short lists
+            if n == 4:
+                r, g, b, a = val
+            else:
+                (r, g, b), a = val, 255
+            num = (int, float)
+            if isinstance(r, num) and isinstance(g, num) and isinstance(b, num) and isinstance(a, num):
+                return Color(int(r), int(g), int(b), int(a))
+    if isinstance(val, dict):
+        r = int(val.get('r', 255))
+        g = int(val.get('g', 255))
+        b = int(val.get('b', 255))
+        a = int(val.get('a', 255))
+        return Color(r, g, b, a)
+    if isinstance(val, int):
+        decoded = ValueTypeDeserializer.decode([ValueTypeID.Color, val])
+        if isinstance(decoded, Color):
+            return decoded
+    if isinstance(val, Color):
+        return val
+    return None
+
+# Component factories by class name; classes without an entry get a plain
+# Component. Each factory falls back to that when the decoder returned an
+# unexpected type.
+def _make_label_comp(comp_tpl: int, comp_cls: str, decoded_component: DecodedComponent,
+                     node_name: Optional[str], node_obj: Optional[Dict[str, Any]],
+                     bundle_instance: Optional['CocosBundle']) -> Component:
+    if not isinstance(decoded_component, LabelComponent):
+        return Component(comp_tpl, comp_cls, decoded_component.properties, decoded_component)
+    # Special handling for Labels - keep backward compatibility
+    text = decoded_component.text
+    font = decoded_component.font_asset
+
+    # Extract node color from object or component properties
+    # Node _color values map directly to our Color dataclass
+    col = None
+    if node_obj and isinstance(node_obj, dict):
+        col = _decode_color(node_obj.get('_color'))
+    if not col and hasattr(decoded_component, 'properties'):
+        col = _decode_color(
+            decoded_component.properties.get('_color') or
+            decoded_component.properties.get('color'))
+
+    comp = LabelComp(comp_tpl, comp_cls, text, font, col)
+    comp.decoded_component = decoded_component
+    comp.properties = decoded_component.properties
+    decoded_component.color = col
+    return comp
+
+def _make_sprite_comp(comp_tpl: int, comp_cls: str, decoded_component: DecodedComponent,
+                      node_name: Optional[str], node_obj: Optional[Dict[str, Any]],
+                      bundle_instance: Optional['CocosBundle']) -> Component:
+    if not isinstance(decoded_component, SpriteComponent):
+        return Component(comp_tpl, comp_cls, decoded_component.properties, decoded_component)
+    # Enhanced sprite frame resolution using comprehensive matching strategies
+    sprite_frames = getattr(bundle_instance, 'sprite_frames', None)
+    if sprite_frames is not None:
+        matched_frame = None
+        
+        # Strategy 1: Exact node name match
+        if node_name and node_name in sprite_frames:
+            matched_frame = node_name
+        
+        # Strategy 2: Use sprite frame asset reference if it maps to a known frame
+        elif decoded_component.sprite_frame and getattr(bundle_instance, 'asset_uuid_map', None) is not None:
+            uuid_name = bundle_instance.asset_uuid_map.get(decoded_component.sprite_frame)
+            if uuid_name is not None and uuid_name in sprite_frames:
+                matched_frame = uuid_name
+        
+        # Strategies 3-5 depend only on the node name; one memoised lookup
+        if not matched_frame:
+            matched_frame = bundle_instance._sprite_frame_for_node(node_name or "")
+        
+        # Apply the matched frame with full resolution
+        if matched_frame and matched_frame in sprite_frames:
+            frame_data = sprite_frames[matched_frame]
+            decoded_component._resolved_frame_name = matched_frame
+            decoded_component._resolved_frame_data = frame_data
+    
+    # Unmatched sprites keep the SpriteComponent field defaults (None)
+    return Component(comp_tpl, comp_cls, decoded_component.properties, decoded_component)
+
+_COMPONENT_FACTORY: Dict[str, Callable[..., Component]] = {
+    "cc.Label": _make_label_comp,
+    "cc.Sprite": _make_sprite_comp,
+}
+
+# Malformed component data (short value-type arrays, unexpected types) raises
+# one of these inside a decoder; anything else is a bug and propagates
+_DECODE_ERRORS = (LookupError, AttributeError, TypeError, ValueError, ArithmeticError)
+
+# The component decoders assume a template's property names line up with the
+# row's value slots, which PackFormatInfo templates don't guarantee yet (cc.Label
+# rows decode against a shifted name list). Until they do, from_raw renders
+# every component through the legacy positional mapping.
+_DECODE_COMPONENTS = False
+
 # ────────────────────────────── Tab-row wrapper ───────────────────────────────
 class TabRow:
     """Decode one packed node instance from pack data.
@@ -1290,7 +2079,6 @@ class TabRow:
         self.raw = raw
 
     @classmethod
- codex/modify-tabrow-to-accept-decoder_engine
     def from_raw(cls,
                  node_row: List[Any],
                  templates: List[Any],
@@ -1298,7 +2086,9 @@ class TabRow:
                  pack_format: Optional[PackFormatInfo] = None,
                  asset_registry: Dict[int, Any] = None,
                  bundle_instance: Optional['CocosBundle'] = None,
-                 decoder_engine: Optional[ComponentDecoderEngine] = None) -> "TabRow":
+                 decoder_engine: Optional[ComponentDecoderEngine] = None,
+                 node_obj: Optional[Dict[str, Any]] = None,
+                 table_row: int = -1) -> "TabRow":
         """Create a :class:`TabRow` from a raw packed node entry.
 
         Parameters
@@ -1318,17 +2108,14 @@ class TabRow:
         decoder_engine:
             Shared :class:`ComponentDecoderEngine` instance to decode
             components. If ``None`` a new engine is created.
+        node_obj:
+            Object-form JSON block for this node, used to look up the
+            node ``_color`` for labels (optional).
+        table_row:
+            Row id of this node in ``pack_format.node_table``; when set, the
+            transform is read from the columnar table instead of re-scanning
+            ``node_row``.
         """
-
-    def from_raw(cls,
-                 node_row: List[Any],
-                 templates: List[Any],
-                 class_of,
-                 pack_format: Optional[PackFormatInfo] = None,
-                 asset_registry: Dict[int, Any] = None,
-                 bundle_instance: Optional['CocosBundle'] = None,
-                 node_obj: Optional[Dict[str, Any]] = None) -> "TabRow":
-        main
         tpl_index = node_row[0]
         node_name = node_row[1] if len(node_row) > 1 and isinstance(node_row[1], str) else None
         parent_index = node_row[2] if len(node_row) > 2 and isinstance(node_row[2], int) else None
@@ -1345,43 +2132,38 @@ class TabRow:
                 if isinstance(val, Size):
                     size = str(val)
             # Very restrictive check for direct size data: must be exactly 2 positive numbers in a small range
-            elif (len(arr) == 2 and 
-                  all(isinstance(x, (int, float)) for x in arr) and
-                  all(x > 0 and x < 5000 for x in arr)):  # Reasonable UI element size range
+            elif len(arr) == 2:
+                # array('d') does the numeric type check for both in one C call
                 try:
+                    w, h = array('d', arr)
+                except (TypeError, OverflowError):
+                    w = h = 0.0
+                if 0 < w < 5000 and 0 < h < 5000:  # Reasonable UI element size range
                     size = f"({_num(arr[0])}×{_num(arr[1])})"
-                except (IndexError, TypeError):
-                    pass
         
         # Do NOT try to extract size from other positions as it often picks up position data
 
-        # Transform - try different indices for transform data
+        # Transform - prefer the pre-decoded columnar table, else probe the row
         pos = rot = scale = "-"
-        trs_data = None
-        
-        # Try to find transform data in different positions
-        for idx in [IDX_TRS, IDX_TRS-1, IDX_TRS+1, -1]:  # Last item sometimes contains transforms
-            if (idx == -1 and len(node_row) > 0) or (0 <= idx < len(node_row)):
-                candidate = node_row[idx] if idx != -1 else node_row[-1]
-                if isinstance(candidate, list) and len(candidate) >= 9:
-                    # Check if this looks like transform data (numbers)
-                    if all(isinstance(x, (int, float)) for x in candidate[:9]):
-                        trs_data = candidate
-                        break
+        node_table = pack_format.node_table if pack_format else None
+        if node_table is not None and table_row >= 0:
+            trs_data = node_table.trs_row(table_row) if node_table.has(table_row, NODE_HAS_TRS) else None
+        else:
+            trs_data = _find_trs(node_row)
         
-        if trs_data:
+        # Identity transforms (the common case) skip all per-component work
+        if trs_data and tuple(trs_data[:9]) != _TRS_IDENTITY:
             # Extract position, rotation, scale from transform data
-            px, py, pz = trs_data[0], trs_data[1], trs_data[2]
-            rx, ry, rz = trs_data[3], trs_data[4], trs_data[5]
-            sx, sy, sz = trs_data[6], trs_data[7], trs_data[8]
+            px, py, pz, rx, ry, rz, sx, sy, sz = trs_data[:9]
+            num = _num
             
             # Always show position if any component is non-zero
             if px != 0 or py != 0:
-                pos = f"({_num(px)},{_num(py)},)"
+                pos = f"({num(px)},{num(py)},)"
             if rx != 0 or ry != 0 or rz != 0:
-                rot = f"({_num(rx)},{_num(ry)},{_num(rz)})"
+                rot = f"({num(rx)},{num(ry)},{num(rz)})"
             if sx != 1 or sy != 1 or sz != 1:
-                scale = f"({_num(sx)},{_num(sy)},{_num(sz)})"
+                scale = f"({num(sx)},{num(sy)},{num(sz)})"
 
         #print(node_row)
         # Components with enhanced property mapping using ComponentDecoder engine
@@ -1389,296 +2171,85 @@ class TabRow:
         decoder_engine = decoder_engine or ComponentDecoderEngine()
         
         if len(node_row) > IDX_OVR and isinstance(node_row[IDX_OVR], list):
+            if _DECODE_COMPONENTS:
+                # One DecodeHelper per component template for the whole pack; its
+                # context (template, registry, class, bundle) is identical for
+                # every component sharing it
+                helper_cache = decoder_engine.helpers
+            
             for comp_row in node_row[IDX_OVR]:
                 if not (isinstance(comp_row, list) and comp_row and isinstance(comp_row[0], int)):
                     continue
                 comp_tpl = comp_row[0]
-                comp_cls = class_of(templates[comp_tpl][0]) if 0 <= comp_tpl < len(templates) else "Unknown"
+                comp_cls, decoder = decoder_engine.get_decoder_by_tpl(comp_tpl, class_of, templates)
                 
                 # Debug: Show what components are being processed
                 # if comp_cls in ["cc.Sprite", "cc.Animation"]:
                 #     print(f"      DEBUG: Processing {comp_cls} component for node '{node_name}'")
                 
-                # Build DecodeHelper with context
-                template_info = None
-                prop_names = []
-                asset_registry = getattr(bundle_instance, 'assets', {}) if bundle_instance else {}
-                
-                if pack_format and comp_tpl in pack_format.class_templates:
-                    template_info = pack_format.class_templates[comp_tpl]
-                    prop_names = template_info.properties
-                
-                helper = DecodeHelper(
-                    template_info=template_info,
-                    asset_registry=asset_registry,
-                    property_names=prop_names,
-                    value_type_decoder=ValueTypeDeserializer
-                )
-                
-                # Add the class method for asset detection with proper asset registry parameter
-                def is_asset_ref(value: int) -> bool:
-                    return (isinstance(value, int) and
-                            (value in asset_registry or
-                             value > ASSET_REF_THRESHOLD))  # Fallback heuristic for large indices
-                helper.is_asset_reference = is_asset_ref
-                
-                # Enhanced asset type detection
-                def get_enhanced_asset_type(asset_id: int) -> str:
-                    if asset_id in asset_registry:
-                        asset_info = asset_registry[asset_id]
-                        if isinstance(asset_info, dict) and 'class' in asset_info:
-                            return asset_info['class']
-                    
-                    return "unknown"
-                
-                helper.get_asset_type = get_enhanced_asset_type
+                template_info = pack_format.template(comp_tpl) if pack_format else None
+                prop_names = template_info.properties if template_info is not None else ()
                 
-                # Use ComponentDecoder engine to decode the component
-                try:
-                    # Pass bundle context to decoders for sprite frame resolution
-                    if hasattr(self, 'sprite_frames'):
-                        helper.sprite_frames = self.sprite_frames
-                    if hasattr(self, 'embedded_animations'):
-                        helper.embedded_animations = self.embedded_animations
-                    
-                    # Store bundle sprite frames for later use
-                    if bundle_instance and hasattr(bundle_instance, 'sprite_frames'):
-                        helper.sprite_frames = bundle_instance.sprite_frames
-                    
-                    # Enhanced sprite frame resolution for components
-                    def resolve_sprite_frame_name(asset_id: int) -> str:
-                        # Try to match sprite frame by node name if asset_id doesn't match directly
-                        current_node_name = node_name if node_name else None
-                        
-                        # Check if we have sprite frames registry
-                        if hasattr(helper, 'sprite_frames') and helper.sprite_frames:
-                            sprite_frames = helper.sprite_frames
-                            # First try: match by node name
-                            if current_node_name and current_node_name in sprite_frames:
-                                frame_data = sprite_frames[current_node_name]
-                                width = frame_data.get('width', 0)
-                                height = frame_data.get('height', 0)
-                                return f'"{current_node_name}" ({width}×{height})'
-                            
-                            # Second try: if there's only one or two sprite frames, use them by process of elimination
-                            sprite_frame_names = list(sprite_frames.keys())
-                            if len(sprite_frame_names) == 1:
-                                frame_name = sprite_frame_names[0]
-                                frame_data = sprite_frames[frame_name]
-                                width = frame_data.get('width', 0)
-                                height = frame_data.get('height', 0)
-                                return f'"{frame_name}" ({width}×{height})'
-                            elif len(sprite_frame_names) == 2:
-                                # Use heuristics - white_loading is usually the small spinning loader, GameIcon is large
-                                for frame_name in sprite_frame_names:
-                                    if current_node_name and frame_name.lower() in current_node_name.lower():
-                                        frame_data = sprite_frames[frame_name]
-                                        width = frame_data.get('width', 0)
-                                        height = frame_data.get('height', 0)
-                                        return f'"{frame_name}" ({width}×{height})'
-                                
-                                # Fallback: match by size - if node is white_loading, use smaller frame; if GameIcon, use larger
-                                if current_node_name:
-                                    if 'white_loading' in current_node_name.lower():
-                                        # Use the smaller sprite frame
-                                        smaller_frame = min(sprite_frame_names, key=lambda f: sprite_frames[f]['width'])
-                                        frame_data = sprite_frames[smaller_frame]
-                                        width = frame_data.get('width', 0)
-                                        height = frame_data.get('height', 0)
-                                        return f'"{smaller_frame}" ({width}×{height})'
-                                    elif 'gameicon' in current_node_name.lower():
-                                        # Use the larger sprite frame
-                                        larger_frame = max(sprite_frame_names, key=lambda f: sprite_frames[f]['width'])
-                                        frame_data = sprite_frames[larger_frame]
-                                        width = frame_data.get('width', 0)
-                                        height = frame_data.get('height', 0)
-                                        return f'"{larger_frame}" ({width}×{height})'
+                comp = None
+                if _DECODE_COMPONENTS:
+                    helper = helper_cache.get(comp_tpl)
+                    if helper is None:
+                        # Build DecodeHelper with context
+                        asset_registry = getattr(bundle_instance, 'assets', {}) if bundle_instance else {}
+                        bundle_sprite_frames = getattr(bundle_instance, 'sprite_frames', None)
+                        bundle_animations = getattr(bundle_instance, 'embedded_animations', None)
+                        helper = helper_cache[comp_tpl] = DecodeHelper(
+                            template_info=template_info,
+                            asset_registry=asset_registry,
+                            property_names=prop_names,
+                            value_type_decoder=ValueTypeDeserializer
+                        )
                         
-                        return f"SpriteFrame#{asset_id}"
+                        # Asset detection / type lookup bound to this bundle's registry; the
+                        # registry is fixed for the pack, so they're built once per class
+                        asset_fns = decoder_engine.asset_fns.get(comp_cls)
+                        if asset_fns is None:
+                            asset_fns = decoder_engine.asset_fns[comp_cls] = (
+                                functools.partial(_enhanced_asset_detection,
+                                                  asset_registry=asset_registry, comp_cls=comp_cls),
+                                functools.partial(_get_enhanced_asset_type, asset_registry=asset_registry))
+                        helper.is_asset_reference, helper.get_asset_type = asset_fns
+                        # Pass bundle context to decoders for sprite frame resolution
+                        if bundle_sprite_frames is not None:
+                            helper.sprite_frames = bundle_sprite_frames
+                        if bundle_animations is not None:
+                            helper.embedded_animations = bundle_animations
+                        # Node-independent: decoders pass node_name=helper.node_name
+                        helper.resolve_sprite_frame_name = functools.partial(
+                            _resolve_sprite_frame_name, sprite_frames=bundle_sprite_frames,
+                            smallest=getattr(bundle_instance, '_sf_smallest', None),
+                            largest=getattr(bundle_instance, '_sf_largest', None))
+                    helper.node_name = node_name
                     
-                    helper.resolve_sprite_frame_name = resolve_sprite_frame_name
-                    
-                    # Enhanced asset reference detection for sprite frames
-                    def enhanced_asset_detection(value: int) -> bool:
-                        if not isinstance(value, int):
-                            return False
-                        # Check if it's in our asset registry
-                        if value in asset_registry:
-                            return True
-                        # For sprite components, be more liberal with asset detection
-                        if comp_cls == "cc.Sprite" and abs(value) > 0:
-                            return True
-                        # Standard detection for other components
-                        return abs(value) > ASSET_REF_THRESHOLD
-                    helper.is_asset_reference = enhanced_asset_detection
-                    
-                    decoded_component = decoder_engine.decode_component(
-                        component_type=comp_cls,
-                        raw_row=comp_row,
-                        prop_names=prop_names,
-                        helper=helper
-                    )
-                    
-                    # Create the component with decoded information
-                    if comp_cls == "cc.Label" and isinstance(decoded_component, LabelComponent):
-                        # Special handling for Labels - keep backward compatibility
-                        text = decoded_component.text
-                        font = decoded_component.font_asset
-
-                        # Extract node color from object or component properties
-                        # Node _color values map directly to our Color dataclass
-                        def _decode_color(val: Any) -> Any:
-                            if val is None:
-                                return None
-                            # Support value-type arrays, dicts or packed ints
-                            if isinstance(val, list):
-                                if ValueTypeDeserializer.is_value_array(val):
-                                    val = ValueTypeDeserializer.decode(val)
-                                    if isinstance(val, Color):
-                                        return val
-                                if len(val) in (3, 4) and all(isinstance(x, (int, float)) for x in val):
-                                    r, g, b = int(val[0]), int(val[1]), int(val[2])
-                                    a = int(val[3]) if len(val) == 4 else 255
-                                    return Color(r, g, b, a)
-                            if isinstance(val, dict):
-                                r = int(val.get('r', 255))
-                                g = int(val.get('g', 255))
-                                b = int(val.get('b', 255))
-                                a = int(val.get('a', 255))
-                                return Color(r, g, b, a)
-                            if isinstance(val, int):
-                                decoded = ValueTypeDeserializer.decode([ValueTypeID.Color, val])
-                                if isinstance(decoded, Color):
-                                    return decoded
-                            if isinstance(val, Color):
-                                return val
-                            return None
-
-                        col = None
-                        if node_obj and isinstance(node_obj, dict):
-                            col = _decode_color(node_obj.get('_color'))
-                        if not col and hasattr(decoded_component, 'properties'):
-                            col = _decode_color(
-                                decoded_component.properties.get('_color') or
-                                decoded_component.properties.get('color'))
-
-                        comp = LabelComp(comp_tpl, comp_cls, text, font, col)
-                        comp.decoded_component = decoded_component
-                        comp.properties = decoded_component.properties
-                        decoded_component.color = col
-                        components.append(comp)
-                    elif comp_cls == "cc.Sprite" and isinstance(decoded_component, SpriteComponent):
-                        # Enhanced sprite frame resolution using comprehensive matching strategies
-                        if bundle_instance and hasattr(bundle_instance, 'sprite_frames'):
-                            sprite_frames = bundle_instance.sprite_frames
-                            matched_frame = None
-                            
-                            # Strategy 1: Exact node name match
-                            if node_name and node_name in sprite_frames:
-                                matched_frame = node_name
-                            
-                            # Strategy 2: Use sprite frame asset reference if it maps to a known frame
-                            elif decoded_component.sprite_frame and hasattr(bundle_instance, 'asset_uuid_map'):
-                                sprite_frame_ref = decoded_component.sprite_frame
-                                # Try to resolve sprite frame reference through UUID mapping
-                                if sprite_frame_ref in bundle_instance.asset_uuid_map:
-                                    uuid_name = bundle_instance.asset_uuid_map[sprite_frame_ref]
-                                    if uuid_name in sprite_frames:
-                                        matched_frame = uuid_name
-                            
-                            # Strategy 3: Smart fuzzy matching by node name
-                            if not matched_frame and node_name:
-                                sprite_frame_names = list(sprite_frames.keys())
-                                
-                                # Try exact substring matching (case insensitive)
-                                for frame_name in sprite_frame_names:
-                                    if (frame_name.lower() in node_name.lower()) or \
-                                       (node_name.lower() in frame_name.lower()):
-                                        matched_frame = frame_name
-                                        break
-                                
-                                # Try common name pattern matching
-                                if not matched_frame:
-                                    # Common patterns: GameIcon/game_icon, white_loading/white-loading, etc.
-                                    normalized_node = node_name.lower().replace('_', '').replace('-', '')
-                                    for frame_name in sprite_frame_names:
-                                        normalized_frame = frame_name.lower().replace('_', '').replace('-', '')
-                                        if normalized_node == normalized_frame or \
-                                           normalized_frame in normalized_node or \
-                                           normalized_node in normalized_frame:
-                                            matched_frame = frame_name
-                                            break
-                            
-                            # Strategy 4: Size-based heuristics for well-known component types
-                            if not matched_frame:
-                                sprite_frame_names = list(sprite_frames.keys())
-                                if len(sprite_frame_names) >= 2:
-                                    if node_name and ('white_loading' in node_name.lower() or 'loading' in node_name.lower()):
-                                        # Use smaller frame for loading components
-                                        matched_frame = min(sprite_frame_names, key=lambda f: sprite_frames[f]['width'])
-                                    elif node_name and ('gameicon' in node_name.lower() or 'icon' in node_name.lower()):
-                                        # Use larger frame for icons
-                                        matched_frame = max(sprite_frame_names, key=lambda f: sprite_frames[f]['width'])
-                            
-                            # Strategy 5: Process of elimination based on available frames
-                            if not matched_frame:
-                                sprite_frame_names = list(sprite_frames.keys())
-                                if len(sprite_frame_names) == 1:
-                                    # Only one sprite frame available, use it
-                                    matched_frame = sprite_frame_names[0]
-                                elif len(sprite_frame_names) == 2:
-                                    # Two frames: usually white_loading (small) and GameIcon (large)
-                                    if 'white_loading' in sprite_frame_names and 'GameIcon' in sprite_frame_names:
-                                        # Default heuristic: if node name suggests loading, use white_loading; otherwise GameIcon
-                                        if node_name and ('loading' in node_name.lower() or 'white' in node_name.lower()):
-                                            matched_frame = 'white_loading'
-                                        else:
-                                            matched_frame = 'GameIcon'
-                                    else:
-                                        # For other combinations, use the first frame as fallback
-                                        matched_frame = sprite_frame_names[0]
-                            
-                            # Apply the matched frame with full resolution
-                            if matched_frame and matched_frame in sprite_frames:
-                                frame_data = sprite_frames[matched_frame]
-                                decoded_component._resolved_frame_name = matched_frame
-                                decoded_component._resolved_frame_data = frame_data
-                                # Ensure the frame information is directly used in display
-                                comp_string = f"<Sprite spriteFrame=\"{matched_frame}\" ({frame_data['width']}×{frame_data['height']}) sizeMode=SIMPLE>"
-                                decoded_component.__str__ = lambda: comp_string
-                        
-                        # Apply sprite frame resolution before creating Component
-                        decoded_component._resolved_frame_name = getattr(decoded_component, '_resolved_frame_name', None)
-                        decoded_component._resolved_frame_data = getattr(decoded_component, '_resolved_frame_data', None)
+                    # Use ComponentDecoder engine to decode the component
+                    try:
+                        decoded_component = decoder.decode(comp_row, prop_names, helper)
                         
-                        comp = Component(
-                            tpl=comp_tpl,
-                            cls=comp_cls,
-                            properties=decoded_component.properties,
-                            decoded_component=decoded_component
-                        )
-                        components.append(comp)
-                    else:
-                        # Generic component with decoded properties
-                        comp = Component(
-                            tpl=comp_tpl,
-                            cls=comp_cls,
-                            properties=decoded_component.properties,
-                            decoded_component=decoded_component
-                        )
-                        components.append(comp)
-                        
-                except Exception as e:
-                    # Fallback to original property mapping if decoder fails
+                        # Create the component with decoded information
+                        factory = _COMPONENT_FACTORY.get(comp_cls)
+                        if factory is not None:
+                            comp = factory(comp_tpl, comp_cls, decoded_component, node_name, node_obj, bundle_instance)
+                        else:
+                            # Generic component with decoded properties
+                            comp = Component(comp_tpl, comp_cls, decoded_component.properties, decoded_component)
+                    except _DECODE_ERRORS:
+                        comp = None
+                
+                if comp is None:
+                    # Legacy positional property mapping (also the fallback if a decoder fails)
                     properties = {}
-                    if pack_format and comp_tpl in pack_format.class_templates:
-                        template_info = pack_format.class_templates[comp_tpl]
+                    if template_info is not None:
+                        n_props = len(prop_names)
                         for i, value in enumerate(comp_row[1:]):
-                            if i < len(template_info.properties):
-                                prop_name = template_info.properties[i]
-                                properties[prop_name] = value
+                            if i < n_props:
+                                properties[prop_names[i]] = value
                             else:
-                                properties[f"prop_{i}"] = value
+                                properties[_prop_fallback_name(i)] = value
                     
                     # Legacy component creation as fallback
                     if comp_cls == "cc.Label":
@@ -1693,9 +2264,9 @@ class TabRow:
                         col  = comp_row[7][0] if len(comp_row) > 7 and isinstance(comp_row[7], list) and comp_row[7] and isinstance(comp_row[7][0], int) else None
                         comp = LabelComp(comp_tpl, comp_cls, text, font, col)
                         comp.properties = properties
-                        components.append(comp)
                     else:
-                        components.append(Component(comp_tpl, comp_cls, properties))
+                        comp = Component(comp_tpl, comp_cls, properties)
+                components.append(comp)
 
         return cls(tpl_index, node_name, parent_index, size, pos, rot, scale, components, node_row)
 
@@ -1707,17 +2278,76 @@ class AssetInfo:
         n = f"'{self.name}'" if self.name else "(no name)"
         return f"[{self.idx:>3}] {self.cls:18} {n:28} {self.path}"
 
-@dataclass
+# Node.key packs (block id, row) into one int. ``stride`` must exceed every row
+# index, i.e. be at least the length of the pack's largest node block
+def _node_key(block_id:int, row:int, stride:int)->int: return block_id*stride+row
+
+@dataclass(slots=True)
 class Node:
-    name:str; cls:str; key:Tuple[int,int]
+    name:str; cls:str; key:int
     pos:str="-"; rot:str="-"; scale:str="-"; anc:str="-"; size:str="-"
     comps:List[Any]=field(default_factory=list)
     children:List["Node"]=field(default_factory=list)
-    assets:Set[int]=field(default_factory=set)
-    def __hash__(self): return hash(self.key)
+    # Unique referenced asset ids; None until the first reference (most nodes have none)
+    assets:Optional[array]=None
+    _child_keys:Set[int]=field(default_factory=set,init=False,repr=False,compare=False)
+    _transform:Optional[str]=field(default=None,init=False,repr=False,compare=False)
+    # Lowercased name for case-insensitive matching, computed once per node
+    name_lower:str=field(default="",init=False,repr=False,compare=False)
+    def __post_init__(self): self.name_lower=self.name.lower() if self.name else ""
+    def __hash__(self): return self.key
     def __eq__(self,o): return isinstance(o,Node) and o.key==self.key
     def add_child(self,c:"Node"): 
-        if c not in self.children: self.children.append(c)
+        if c.key not in self._child_keys:
+            self._child_keys.add(c.key); self.children.append(c)
+    def add_asset(self,a:int):
+        if self.assets is None: self.assets=array('i',(a,))
+        elif a not in self.assets: self.assets.append(a)
+    def transform_str(self)->str:
+        """`` pos=… rot=… scale=… anc=… size=…`` for the set fields ("" if none), built once."""
+        if self._transform is None:
+            parts=[f"{k}={v}" for k,v in (("pos",self.pos),("rot",self.rot),("scale",self.scale),
+                                          ("anc",self.anc),("size",self.size)) if v!="-"]
+            self._transform=f" {' '.join(parts)}" if parts else ""
+        return self._transform
+
+@dataclass(slots=True)
+class SceneColumns:
+    """Columnar view of one scene block's nodes, indexed by packed row.
+
+    Passes that only need one or two fields (root search, sorting by name)
+    scan ``names``/``classes``/``keys`` instead of touching every Node; the
+    full records stay in ``nodes`` for printing.
+    """
+    keys:List[int]=field(default_factory=list)
+    names:List[str]=field(default_factory=list)
+    classes:List[str]=field(default_factory=list)
+    nodes:List[Node]=field(default_factory=list)
+    def append(self,n:Node):
+        self.keys.append(n.key); self.names.append(n.name); self.classes.append(n.cls)
+        self.nodes.append(n)
+    def __len__(self): return len(self.nodes)
+
+class _ClassNames(dict):
+    """Class name by class-def index, built once per pack.
+
+    ``class_of = _ClassNames(class_defs).__getitem__`` resolves known indices
+    with a plain dict hit; anything else renders as ``C?<i>``.
+    """
+    __slots__ = ()
+    def __init__(self, class_defs: List[Any]):
+        super().__init__((i, c[0]) for i, c in enumerate(class_defs) if isinstance(c, list))
+    def __missing__(self, i): return f"C?{i}"
+
+@contextlib.contextmanager
+def _batched_stdout():
+    """Collect everything printed inside the block and write it to stdout in one call."""
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            yield
+    finally:
+        sys.stdout.write(buf.getvalue())
 
 # ───────────────────────────── Bundle inspector ──────────────────────────────
 class CocosBundle:
@@ -1735,6 +2365,9 @@ class CocosBundle:
         IDX_FIRST: Index where actual node data begins (5)
     """
     IDX_CLASS, IDX_TPL, IDX_FIRST = 3, 4, 5
+    # Asset classes that get a readable synthetic path in ``self.assets``
+    _ASSET_CLASSES = frozenset(("cc.SpriteFrame", "cc.Material", "cc.Font",
+                                "cc.Texture2D", "cc.AudioClip", "cc.Prefab"))
     
     def __init__(self, cfg: Union[str, Path]) -> None:
         """Initialize bundle inspector from configuration file.
@@ -1749,17 +2382,20 @@ class CocosBundle:
         - versions: Version mappings for pack files
         """
         self.cfg_path = Path(cfg).resolve()
-        self.cfg      = json.loads(self.cfg_path.read_text("utf8"))
+        self.cfg      = _json.loads(self.cfg_path.read_bytes())
         self.root     = self.cfg_path.parent
         self.import_base = self.cfg.get("importBase","import")
         self.paths: Dict[str, Any] = self.cfg.get("paths", {})
         self.packs: Dict[str, list] = self.cfg.get("packs", {})
         self.ver = self._ver_map()
         self.pack_formats: Dict[str, PackFormatInfo] = {}  # Cache for pack format info
+        self.format_cache: Optional[Path] = None  # Sidecar dir for pickled PackFormatInfo (opt-in)
         self.show_full_assets = False  # Show only referenced assets by default
 
     def run(self):  # CLI entry
-        for label, p in self._packs(): self._inspect_pack(label,p)
+        for label, p in self._packs():
+            # Per-pack report is emitted in one write instead of thousands of prints
+            with _batched_stdout(): self._inspect_pack(label,p)
 
     def _ver_map(self)->Dict[str,str]:
         raw = self.cfg.get("versions", {}).get("import", [])
@@ -1780,7 +2416,7 @@ class CocosBundle:
         passed to all :meth:`TabRow.from_raw` calls so component decoders
         can share state across nodes.
         """
-        data=json.loads(pack.read_text("utf8"))
+        data=_json.loads(pack.read_bytes())
         if not (isinstance(data,list) and len(data)>self.IDX_FIRST):
             return print(f"[skip] {label}")
         print(f"\n=== {label} ===")
@@ -1793,13 +2429,14 @@ class CocosBundle:
 
         # Enhanced pack format analysis
         try:
-            pack_format = PackFormatInfo.from_pack_data(data)
+            pack_format = self._pack_format(pack, data)
             self.pack_formats[label] = pack_format
             print(f"    Pack format: v{pack_format.format_version}, {pack_format.uuids_count} UUIDs, {len(pack_format.property_names)} properties")
-            print(f"    Class templates: {len(pack_format.class_templates)} mapped")
+            resolved = [t for t in pack_format.class_templates if t is not None]
+            print(f"    Class templates: {len(resolved)} mapped")
             
             # Print unique classes found
-            unique_classes = set(template.class_name for template in pack_format.class_templates.values())
+            unique_classes = set(template.class_name for template in resolved)
             print(f"    Unique classes: {', '.join(sorted(unique_classes))}")
         except Exception as e:
             print(f"    Warning: Could not parse pack format: {e}")
@@ -1807,40 +2444,27 @@ class CocosBundle:
 
         class_defs=data[self.IDX_CLASS]; templates=data[self.IDX_TPL]
         blocks=self._blocks(data[self.IDX_FIRST:])
-        class_of=lambda i:class_defs[i][0] if 0<=i<len(class_defs) and isinstance(class_defs[i],list) else f"C?{i}"
+        class_of=_ClassNames(class_defs).__getitem__
         assets=self._asset_index(templates,class_of)
         offs=self._block_offs(blocks)
         block_id=self._scene_block(blocks,templates,class_of); rows=blocks[block_id]
+        key_stride=max(map(len,blocks))
 
- codex/modify-tabrow-to-accept-decoder_engine
         decoder_engine = ComponentDecoderEngine()
-        nodes:Dict[Tuple[int,int],Node]={}
-        for i, raw in enumerate(rows):
-            # Pass the bundle instance to TabRow for sprite frame resolution
-            row = TabRow.from_raw(
-                raw,
-                templates,
-                class_of,
-                pack_format,
-                asset_registry=getattr(self, 'assets', {}),
-                bundle_instance=self,
-                decoder_engine=decoder_engine,
-            )
-            g_idx = offs[block_id]+i
-            obj = data[g_idx] if 0<=g_idx<len(data) and isinstance(data[g_idx],dict) else {}
-
-        nodes:Dict[Tuple[int,int],Node]={}
+        scene=SceneColumns(); objs=[]; child_lists=[]
         for i, raw in enumerate(rows):
             g_idx = offs[block_id]+i
             obj = data[g_idx] if 0<=g_idx<len(data) and isinstance(data[g_idx],dict) else {}
+            objs.append(obj); child_lists.append(_child_offsets(raw))
             # Pass the bundle instance and node object to TabRow
             row = TabRow.from_raw(
                 raw, templates, class_of, pack_format,
                 asset_registry=getattr(self, 'assets', {}),
                 bundle_instance=self,
+                decoder_engine=decoder_engine,
                 node_obj=obj,
+                table_row=pack_format.node_table.row_id(block_id, i) if pack_format and pack_format.node_table else -1,
             )
- main
             # Enhanced size extraction: try object block's "_contentSize" if not found in raw_row
             enhanced_size = row.size
             if enhanced_size == "-" and "_contentSize" in obj:
@@ -1878,15 +2502,7 @@ class CocosBundle:
             # Second try: Look in packed transform extension (some versions embed it right after scale)
             elif anc == "-":
                 # Try to find transform data in the raw row for anchor extraction
-                trs_data = None
-                for idx in [IDX_TRS, IDX_TRS-1, IDX_TRS+1, -1]:  # Last item sometimes contains transforms
-                    if (idx == -1 and len(raw) > 0) or (0 <= idx < len(raw)):
-                        candidate = raw[idx] if idx != -1 else raw[-1]
-                        if isinstance(candidate, list) and len(candidate) >= 9:
-                            # Check if this looks like transform data (numbers)
-                            if all(isinstance(x, (int, float)) for x in candidate[:9]):
-                                trs_data = candidate
-                                break
+                trs_data = _find_trs(raw)
                 
                 if trs_data and len(trs_data) > 9:
                     # Check if there are anchor point values after the standard 9 transform components
@@ -1904,58 +2520,55 @@ class CocosBundle:
             n=Node(
                 name=row.name or f"node_{block_id}_{i}",
                 cls =class_of(templates[row.tpl][0]),
-                key =(block_id,i),
+                key =_node_key(block_id,i,key_stride),
                 pos=row.pos, rot=row.rot, scale=row.scale, size=final_size, anc=anc,
                 comps=row.components
             )
             self._collect_refs(raw,assets,n)
             # Also collect refs from the object data
             self._collect_refs(obj,assets,n)
-            nodes[n.key]=n
+            scene.append(n)
 
         # Unified child/parent graph construction
         # 1. Prefer _children array from object JSON
         # 2. Fall back to parent index in packed row
         # 3. Deduplicate links
-        child_keys = set()
+        # Each pass must see every link claimed by the earlier ones, so the passes
+        # stay separate; rows are addressed by local index (scene.nodes[i] is
+        # node (block_id, i)) and ``linked`` replaces the set of child keys.
+        node_list = scene.nodes; n_rows = len(node_list)
+        linked = bytearray(n_rows)
         
         # First pass: Process _children arrays from object JSON (preferred)
-        for i, raw in enumerate(rows):
-            g_idx = offs[block_id] + i
-            obj = data[g_idx] if 0 <= g_idx < len(data) and isinstance(data[g_idx], dict) else {}
-            
-            if "_children" in obj and isinstance(obj["_children"], list):
-                parent_node = nodes[(block_id, i)]
-                for child_ref in obj["_children"]:
-                    if isinstance(child_ref, int):
-                        child_key = (block_id, child_ref)
-                        if child_key in nodes and child_key not in child_keys:
-                            parent_node.add_child(nodes[child_key])
-                            child_keys.add(child_key)
+        for i, obj in enumerate(objs):
+            children = obj.get("_children")
+            if isinstance(children, list):
+                parent_node = node_list[i]
+                for child_ref in children:
+                    if isinstance(child_ref, int) and 0 <= child_ref < n_rows and not linked[child_ref]:
+                        parent_node.add_child(node_list[child_ref])
+                        linked[child_ref] = 1
         
         # Second pass: Fall back to parent index in packed row for nodes without established relationships
         for i, raw in enumerate(rows):
-            child_key = (block_id, i)
-            if child_key not in child_keys:  # Only process if not already linked
-                p = raw[2] if len(raw) > 2 and isinstance(raw[2], int) else None
-                if p is not None and (block_id, p) in nodes:
-                    nodes[(block_id, p)].add_child(nodes[child_key])
-                    child_keys.add(child_key)
+            if not linked[i] and len(raw) > 2:  # Only process if not already linked
+                p = raw[2]
+                if isinstance(p, int) and 0 <= p < n_rows:
+                    node_list[p].add_child(node_list[i])
+                    linked[i] = 1
         
         # Third pass: Process other child lists from packed data for remaining unlinked nodes
-        for i, raw in enumerate(rows):
-            parent_node = nodes[(block_id, i)]
-            for lst in raw[3:]:
-                if isinstance(lst, list) and lst and all(isinstance(x, (int, float)) for x in lst):
-                    for off in map(int, lst):
-                        child_key = (block_id, i + (-off) if off < 0 else off)
-                        if (child_key in nodes and 
-                            child_key not in child_keys and 
-                            child_key != parent_node.key):
-                            parent_node.add_child(nodes[child_key])
-                            child_keys.add(child_key)
-                    break
-        self._p_h(nodes); self._p_assets(assets, nodes); self._p_refs(nodes)
+        # (candidate list per row found once by _child_offsets while building nodes)
+        for i, lst in enumerate(child_lists):
+            if lst is None:
+                continue
+            parent_node = node_list[i]
+            for off in map(int, lst):
+                c = i + (-off) if off < 0 else off
+                if 0 <= c < n_rows and not linked[c] and c != i:
+                    parent_node.add_child(node_list[c])
+                    linked[c] = 1
+        self._p_h(scene); self._p_assets(assets, scene); self._p_refs(scene)
     
     def _extract_sprite_frames_and_assets(self, data: List[Any]) -> None:
         """Extract sprite frame details and asset information from pack data."""
@@ -1964,73 +2577,151 @@ class CocosBundle:
         
         # Initialize registries
         if not hasattr(self, 'sprite_frames'):
-            self.sprite_frames = {}
+            self.sprite_frames: Dict[str, SpriteFrame] = {}
         if not hasattr(self, 'asset_uuid_map'):
             self.asset_uuid_map = {}
         
-        # Search recursively through all data blocks for sprite frames and assets
-        def search_for_assets(obj, depth=0):
-            if depth > 10:  # Prevent infinite recursion
-                return
-                
-            if isinstance(obj, dict):
-                # Check for sprite frame data
-                if "name" in obj and "rect" in obj and "originalSize" in obj:
-                    frame_name = obj["name"]
-                    rect = obj.get("rect", [0, 0, 0, 0])
-                    original_size = obj.get("originalSize", [0, 0])
-                    offset = obj.get("offset", [0, 0])
-                    cap_insets = obj.get("capInsets", [0, 0, 0, 0])
-                    
-                    self.sprite_frames[frame_name] = {
-                        "name": frame_name,
-                        "rect": rect,
-                        "originalSize": original_size,
-                        "offset": offset,
-                        "capInsets": cap_insets,
-                        "width": original_size[0] if len(original_size) >= 1 else 0,
-                        "height": original_size[1] if len(original_size) >= 2 else 0
-                    }
+        sprite_frames, asset_uuid_map = self.sprite_frames, self.asset_uuid_map
+
+        def record_frame(obj):
+            frame_name = obj["name"]
+            # Tuple defaults are code constants: no list is built when the key exists
+            rect = obj.get("rect", (0, 0, 0, 0))
+            original_size = obj.get("originalSize", (0, 0))
+            offset = obj.get("offset", (0, 0))
+            cap_insets = obj.get("capInsets", (0, 0, 0, 0))
+            
+            sprite_frames[frame_name] = SpriteFrame(
+                frame_name, rect, original_size, offset, cap_insets,
+                original_size[0] if len(original_size) >= 1 else 0,
+                original_size[1] if len(original_size) >= 2 else 0,
+            )
+            
+            print(f"    Found sprite frame: '{frame_name}' ({original_size[0]}×{original_size[1]}) rect={rect}")
+        
+        # Search all data blocks for sprite frames and assets with an explicit
+        # depth-first stack of (obj, depth, in_list). Children are pushed in
+        # reverse so frames are found (and printed) in the same pre-order as the
+        # nested walk; only containers are pushed. ``seen`` (by id, shared
+        # across blocks) skips containers referenced from several parents.
+        stack = []
+        seen = set()
+        for block in data[self.IDX_FIRST:]:
+            stack.append((block, 0, False))
+            while stack:
+                obj, depth, in_list = stack.pop()
+                is_dict = isinstance(obj, dict)
+                if in_list and is_dict and "rect" in obj and "name" in obj:
+                    # Sprite frame entry of a frame list (recorded at the list's depth)
+                    record_frame(obj)
+                    continue
+                if depth > 10:  # Prevent runaway nesting
+                    continue
+                if id(obj) in seen:
+                    continue
+                seen.add(id(obj))
                     
-                    print(f"    Found sprite frame: '{frame_name}' ({original_size[0]}×{original_size[1]}) rect={rect}")
-                
-                # Check for UUID references
-                if "__uuid__" in obj:
-                    uuid = obj["__uuid__"]
-                    if "name" in obj:
-                        self.asset_uuid_map[uuid] = obj["name"]
+                if is_dict:
+                    # Check for sprite frame data (rarest key first: most dicts fail on one probe)
+                    if "originalSize" in obj and "rect" in obj and "name" in obj:
+                        record_frame(obj)
                     
-                # Recursively search dictionary values
-                for value in obj.values():
-                    search_for_assets(value, depth + 1)
-                    
-            elif isinstance(obj, list):
-                # Check if this is a sprite frame list
-                for item in obj:
-                    if isinstance(item, dict) and "name" in item and "rect" in item:
-                        frame_name = item["name"]
-                        rect = item.get("rect", [0, 0, 0, 0])
-                        original_size = item.get("originalSize", [0, 0])
-                        offset = item.get("offset", [0, 0])
-                        cap_insets = item.get("capInsets", [0, 0, 0, 0])
-                        
-                        self.sprite_frames[frame_name] = {
-                            "name": frame_name,
-                            "rect": rect,
-                            "originalSize": original_size,
-                            "offset": offset,
-                            "capInsets": cap_insets,
-                            "width": original_size[0] if len(original_size) >= 1 else 0,
-                            "height": original_size[1] if len(original_size) >= 2 else 0
-                        }
+                    # Check for UUID references
+                    if "__uuid__" in obj:
+                        uuid = obj["__uuid__"]
+                        if "name" in obj:
+                            asset_uuid_map[uuid] = obj["name"]
                         
-                        print(f"    Found sprite frame: '{frame_name}' ({original_size[0]}×{original_size[1]}) rect={rect}")
+                    # Search dictionary values
+                    depth += 1
+                    stack.extend([(value, depth, False) for value in reversed(obj.values())
+                                  if isinstance(value, (dict, list))])
+                    
+                elif isinstance(obj, list):
+                    # Items may be sprite frames of a frame list, or nested data
+                    depth += 1
+                    stack.extend([(item, depth, True) for item in reversed(obj)
+                                  if isinstance(item, (dict, list))])
+        self._index_sprite_frames()
+
+    def _index_sprite_frames(self) -> None:
+        """Precompute the name forms used by sprite-frame matching.
+
+        Built once per extracted pack so per-node matching doesn't re-list,
+        lowercase and normalise every frame name. Lists keep the
+        ``sprite_frames`` order, which decides ties between candidates.
+        """
+        names = list(self.sprite_frames)
+        lowered = [name.lower() for name in names]
+        self._sf_lower = list(zip(lowered, names))
+        self._sf_norm = [(low.replace('_', '').replace('-', ''), name) for low, name in self._sf_lower]
+        # Widths as one typed column parallel to names; min()/index() then
+        # pick the first narrowest/widest frame without per-item key calls
+        widths = [frame.width for frame in self.sprite_frames.values()]
+        try:
+            widths = array('d', widths)
+        except (TypeError, OverflowError):
+            pass  # non-numeric widths: keep the list, compared as-is
+        self._sf_names = names
+        self._sf_widths = widths
+        self._sf_smallest = names[widths.index(min(widths))] if names else None
+        self._sf_largest = names[widths.index(max(widths))] if names else None
+        self._sf_by_node: Dict[str, Optional[str]] = {}
+
+    def _sprite_frame_for_node(self, node_name: str) -> Optional[str]:
+        """Match a Sprite node to a frame by name alone (fuzzy, size and
+        elimination heuristics), memoised per node name.
+
+        Node names repeat heavily across a pack (``Background``, ``icon`` ...),
+        so each distinct name runs the ordered frame scans only once.
+        """
+        try:
+            return self._sf_by_node[node_name]
+        except KeyError:
+            pass
+        sprite_frames = self.sprite_frames
+        matched_frame = None
+        node_lower = node_name.lower()
+
+        # Fuzzy matching: first frame, in sprite_frames order, whose lowered
+        # (then '_'/'-'-stripped) name contains or is contained in the node's
+        if node_name:
+            for frame_lower, frame_name in self._sf_lower:
+                if frame_lower in node_lower or node_lower in frame_lower:
+                    matched_frame = frame_name
+                    break
+            if not matched_frame:
+                # Common patterns: GameIcon/game_icon, white_loading/white-loading, etc.
+                normalized_node = node_lower.replace('_', '').replace('-', '')
+                for normalized_frame, frame_name in self._sf_norm:
+                    if normalized_frame in normalized_node or \
+                       normalized_node in normalized_frame:
+                        matched_frame = frame_name
+                        break
+
+        # Size-based heuristics for well-known component types
+        if not matched_frame and len(sprite_frames) >= 2:
+            if 'loading' in node_lower:  # also covers white_loading
+                matched_frame = self._sf_smallest
+            elif 'icon' in node_lower:  # also covers gameicon
+                matched_frame = self._sf_largest
+
+        # Process of elimination based on available frames
+        if not matched_frame:
+            if len(sprite_frames) == 1:
+                matched_frame = next(iter(sprite_frames))
+            elif len(sprite_frames) == 2:
+                # Two frames: usually white_loading (small) and GameIcon (large)
+                if 'white_loading' in sprite_frames and 'GameIcon' in sprite_frames:
+                    if 'loading' in node_lower or 'white' in node_lower:
+                        matched_frame = 'white_loading'
                     else:
-                        search_for_assets(item, depth + 1)
-        
-        # Search all data blocks
-        for block in data[self.IDX_FIRST:]:
-            search_for_assets(block)
+                        matched_frame = 'GameIcon'
+                else:
+                    matched_frame = next(iter(sprite_frames))
+
+        self._sf_by_node[node_name] = matched_frame
+        return matched_frame
     
     def _extract_embedded_animation_clips(self, data: List[Any]) -> None:
         """Extract embedded animation clips from the first data block and add to asset registry."""
@@ -2115,34 +2806,57 @@ class CocosBundle:
             
             # Store in asset registry for component decoders to use
             if not hasattr(self, 'embedded_animations'):
-                self.embedded_animations = {}
-            self.embedded_animations[clip_name] = {
-                "name": clip_name,
-                "duration": duration,
-                "wrap_mode": wrap_mode,
-                "sample_rate": sample_rate,
-                "curves": curves_data,
-                "class": "cc.AnimationClip"
-            }
+                self.embedded_animations: Dict[str, EmbeddedClip] = {}
+            self.embedded_animations[clip_name] = EmbeddedClip(
+                clip_name, duration, wrap_mode, sample_rate, curves_data)
+
+    # Bump when PackFormatInfo (or anything it holds) changes shape
+    _FORMAT_CACHE_VERSION = 1
+
+    def _pack_format(self, pack: Path, data: List[Any]) -> PackFormatInfo:
+        """PackFormatInfo for ``pack``, reused from ``self.format_cache`` when unchanged.
+
+        Sidecar entries are keyed by the pack's path, mtime and size; any
+        unreadable or stale entry is simply rebuilt and overwritten. The
+        sidecar file name carries a hash of the full pack path, so packs with
+        the same file name in different directories get separate entries.
+        """
+        if self.format_cache is None:
+            return PackFormatInfo.from_pack_data(data)
+        st = pack.stat()
+        key = (self._FORMAT_CACHE_VERSION, str(pack), st.st_mtime_ns, st.st_size)
+        path_tag = hashlib.sha1(str(pack).encode("utf8")).hexdigest()[:16]
+        sidecar = self.format_cache / f"{pack.name}.{path_tag}.pkl"
+        try:
+            with sidecar.open("rb") as f:
+                cached_key, info = pickle.load(f)
+            if cached_key == key and isinstance(info, PackFormatInfo):
+                return info
+        except Exception:
+            pass  # missing, truncated or from an older layout
+        info = PackFormatInfo.from_pack_data(data)
+        try:
+            self.format_cache.mkdir(parents=True, exist_ok=True)
+            with sidecar.open("wb") as f:
+                pickle.dump((key, info), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"    Warning: Could not write format cache: {e}")
+        return info
 
     @staticmethod
     def _blocks(q:list)->List[list]:
-        out,ql=[],list(q)
-        while ql:
-            b=ql.pop(0)
-            if isinstance(b,list):
-                if b and isinstance(b[0],list) and isinstance(b[0][0],int): out.append(b)
-                elif b and isinstance(b[0],list): ql[0:0]=b
-        return out
+        return _node_blocks(q)
     def _block_offs(self,blks):
         offs,cur=[],self.IDX_FIRST
         for b in blks: offs.append(cur); cur+=len(b)
         return offs
     def _scene_block(self,blks,tpls,class_of):
+        # Resolve which templates are cc.Scene once, so rows only need a set probe
+        scene_tpls={t for t,tpl in enumerate(tpls) if isinstance(tpl,list) and tpl and class_of(tpl[0])=="cc.Scene"}
+        if not scene_tpls: return len(blks)-1
         for i in reversed(range(len(blks))):
             for row in blks[i]:
-                if isinstance(row,list) and row and isinstance(row[0],int):
-                    if class_of(tpls[row[0]][0])=="cc.Scene": return i
+                if isinstance(row,list) and row and isinstance(row[0],int) and row[0] in scene_tpls: return i
         return len(blks)-1
 
     def _asset_index(self,templates,class_of):
@@ -2151,28 +2865,24 @@ class CocosBundle:
         
         for s,p in self.paths.items():
             ti=int(s)
-            if 0<=ti<len(templates) and isinstance(templates[ti],list) and isinstance(templates[ti][0],int):
-                tpl=templates[ti]
+            tpl=templates[ti] if 0<=ti<len(templates) else None
+            if isinstance(tpl,list) and isinstance(tpl[0],int):
                 cls_name = class_of(tpl[0])
                 asset_name = tpl[1] if len(tpl)>1 and isinstance(tpl[1],str) else None
+                path_str = p[0] if isinstance(p,list) and p else "(no path)"
                 
-                idx[ti]=AssetInfo(ti, cls_name,
-                                  asset_name,
-                                  p[0] if isinstance(p,list) and p else "(no path)")
+                idx[ti]=AssetInfo(ti, cls_name, asset_name, path_str)
                 
                 # Store assets with readable synthetic paths for known asset classes
-                if cls_name in ["cc.SpriteFrame", "cc.Material", "cc.Font", "cc.Texture2D", "cc.AudioClip", "cc.Prefab"]:
+                if cls_name in self._ASSET_CLASSES:
                     # Create synthetic path: assets/<cls>/<name or tplIdx>
-                    if asset_name:
-                        synthetic_path = f"assets/{cls_name}/{asset_name}"
-                    else:
-                        synthetic_path = f"assets/{cls_name}/template_{ti}"
+                    synthetic_path = f"assets/{cls_name}/{asset_name or f'template_{ti}'}"
                     
                     assets[synthetic_path] = {
                         "template_index": ti,
                         "class": cls_name,
                         "name": asset_name,
-                        "path": p[0] if isinstance(p,list) and p else "(no path)",
+                        "path": path_str,
                         "synthetic_path": synthetic_path
                     }
         
@@ -2181,107 +2891,93 @@ class CocosBundle:
         return idx
     @staticmethod
     def _collect_refs(itm,assets,n):
-        if isinstance(itm,bool): return
-        if isinstance(itm,int) and itm in assets: n.assets.add(itm)
-        elif isinstance(itm,list):
-            for sub in itm: CocosBundle._collect_refs(sub,assets,n)
-        elif isinstance(itm,dict):
-            for sub in itm.values(): CocosBundle._collect_refs(sub,assets,n)
+        # Parsed JSON only holds exact builtin types, so type() identity replaces
+        # isinstance (and excludes bools without a separate check). Iterative:
+        # assets are deduplicated and printed sorted, so visit order is irrelevant.
+        stack=[itm]
+        while stack:
+            itm=stack.pop(); t=type(itm)
+            if t is int:
+                if itm in assets: n.add_asset(itm)
+            elif t is list: stack.extend(itm)
+            elif t is dict: stack.extend(itm.values())
 
     @staticmethod
-    def _p_h(nodes):
-        """Recursive pretty-print with indentation, guaranteeing single root (scene)."""
+    def _p_h(scene: SceneColumns):
+        """Pretty-print the scene tree with indentation, guaranteeing single root (scene)."""
         print("    Scene graph:")
-        all_nodes = list(nodes.values())
+        all_nodes = scene.nodes
         if not all_nodes: 
             print("      [no nodes]")
             return
             
         # Find all children to identify root candidates
-        children_keys = set()
-        for node in all_nodes:
-            for child in node.children:
-                children_keys.add(child.key)
+        children_keys = {child.key for node in all_nodes for child in node.children}
         
         # Find the root - prefer Scene node, otherwise any node without a parent
-        scene_nodes = [n for n in all_nodes if n.cls == "cc.Scene"]
-        root_candidates = [n for n in all_nodes if n.key not in children_keys]
+        # (only the class/key columns are scanned)
+        scene_idx = scene.classes.index("cc.Scene") if "cc.Scene" in scene.classes else -1
+        root_idx = next((i for i, k in enumerate(scene.keys) if k not in children_keys), -1)
         
         # Guarantee a single root
-        if scene_nodes:
+        if scene_idx >= 0:
             # Prefer Scene node as root
-            root = scene_nodes[0]
-        elif root_candidates:
+            root = all_nodes[scene_idx]
+        elif root_idx >= 0:
             # Use first root candidate if no Scene node
-            root = root_candidates[0]
+            root = all_nodes[root_idx]
         else:
             # Fallback: use first node if all seem to be children (circular or orphaned)
             root = all_nodes[0]
         
-        # Recursive pretty-print starting from root
-        def print_node(node: Node, indent: int = 0):
-            """Recursively print node and its children with proper indentation."""
-            prefix = "  " * indent + "- "
-            
-            # Enhanced node line format: name (cls) pos=… rot=… scale=… anc=… size=…
-            transform_parts = []
-            if node.pos != "-":
-                transform_parts.append(f"pos={node.pos}")
-            if node.rot != "-":
-                transform_parts.append(f"rot={node.rot}")
-            if node.scale != "-":
-                transform_parts.append(f"scale={node.scale}")
-            if node.anc != "-":
-                transform_parts.append(f"anc={node.anc}")
-            if node.size != "-":
-                transform_parts.append(f"size={node.size}")
-            
-            transform_str = f" {' '.join(transform_parts)}" if transform_parts else ""
-            
-            # Main node line
-            print(f"      {prefix}{node.name} ({node.cls}){transform_str}")
-            
-            # Under each node, list decoded components with their __str__
-            if node.comps:
-                for comp in node.comps:
-                    comp_indent = "  " * (indent + 1) + "    "  # Extra indentation for components
-                    if comp.decoded_component:
-                        # Use the decoded component's __str__ method
-                        decoded_str = str(comp.decoded_component)
-                        print(f"      {comp_indent}└─ {decoded_str}")
-                    else:
-                        # Fallback to basic component info
-                        print(f"      {comp_indent}└─ {comp}")
-            
-            # Show asset references if any
-            if node.assets:
-                asset_indent = "  " * (indent + 1) + "    "
-                print(f"      {asset_indent}[assets: {','.join(map(str,sorted(node.assets)))}]")
-            
-            # Recursively print children with increased indentation
-            for child in sorted(node.children, key=lambda c: c.name):
-                print_node(child, indent + 1)
+        # Depth-first pretty-print with an explicit stack; children are pushed
+        # name-sorted in reverse so they pop in order. ``visited`` guards against
+        # cycles and, for the root walk, doubles as the reachable set.
+        def print_tree(start: Node, visited: Set[int]):
+            """Print ``start`` and its subtree with proper indentation."""
+            stack = [(start, 0)]
+            while stack:
+                node, indent = stack.pop()
+                if node.key in visited:
+                    continue
+                visited.add(node.key)
+                prefix = "  " * indent + "- "
+                
+                # Enhanced node line format: name (cls) pos=… rot=… scale=… anc=… size=…
+                print(f"      {prefix}{node.name} ({node.cls}){node.transform_str()}")
+                
+                # Under each node, list decoded components with their __str__
+                sub_indent = "  " * (indent + 1) + "    "  # Extra indentation for components/assets
+                if node.comps:
+                    for comp in node.comps:
+                        if comp.decoded_component:
+                            # Use the decoded component's __str__ method
+                            print(f"      {sub_indent}└─ {comp.decoded_component}")
+                        else:
+                            # Fallback to basic component info
+                            print(f"      {sub_indent}└─ {comp}")
+                
+                # Show asset references if any
+                if node.assets:
+                    print(f"      {sub_indent}[assets: {','.join(map(str,sorted(node.assets)))}]")
+                
+                # Queue children with increased indentation
+                if node.children:
+                    indent += 1
+                    stack.extend([(child, indent) for child in
+                                  reversed(sorted(node.children, key=lambda c: c.name))])
         
-        # Start recursive printing from root
-        print_node(root)
+        # Start printing from root
+        visited: Set[int] = set()
+        print_tree(root, visited)
         
         # Print any orphaned nodes that aren't connected to the main tree
-        visited = set()
-        def mark_visited(node: Node):
-            if node.key in visited:
-                return
-            visited.add(node.key)
-            for child in node.children:
-                mark_visited(child)
-        
-        mark_visited(root)
-        
         orphaned = [n for n in all_nodes if n.key not in visited]
         if orphaned:
             print("\n      Orphaned nodes (not connected to main tree):")
             for node in orphaned:
-                print_node(node)
-    def _p_assets(self, assets_dict, nodes):
+                print_tree(node, set())
+    def _p_assets(self, assets_dict, scene: SceneColumns):
         """Print asset table - full table if --assets flag is set, otherwise only referenced assets."""
         if not assets_dict:
             return
@@ -2294,8 +2990,9 @@ class CocosBundle:
         else:
             # Show only referenced assets
             referenced_assets = set()
-            for node in nodes.values():
-                referenced_assets.update(node.assets)
+            for node in scene.nodes:
+                if node.assets:
+                    referenced_assets.update(node.assets)
             
             if referenced_assets:
                 print("    File assets (referenced only):")
@@ -2304,86 +3001,88 @@ class CocosBundle:
                         print("      " + assets_dict[asset_id].row())
             else:
                 print("    File assets: [none referenced]")
-    def _p_refs(self, nodes):
+    def _p_refs(self, scene: SceneColumns):
         """Enhanced asset reference display with comprehensive sprite frame name resolution and animation targets."""
         print("    Node → asset refs:")
         anyr = False
         
+        # Per-bundle state is fixed for the whole loop: bind it once
+        sprite_frames = getattr(self, 'sprite_frames', None)
+        sf_lower = getattr(self, '_sf_lower', ())
+        # Embedded-clip fallback ref is the same for every node; build it once
+        anim_fallback = None
+        embedded = getattr(self, 'embedded_animations', None)
+        if embedded:
+            clip_name, clip_data = next(iter(embedded.items()))
+            # Extract targets from the first available clip
+            curves = clip_data.curves
+            targets = list(curves['paths'].keys()) if isinstance(curves, dict) and 'paths' in curves else []
+            if targets:
+                anim_fallback = f"AnimationClip[{clip_name}] → targets: [{', '.join(targets)}]"
+            else:
+                anim_fallback = f"AnimationClip[{clip_name}]"
+        sprite_cls, label_cls, anim_cls = SpriteComponent, LabelComponent, AnimationComponent
+        
         # Build comprehensive asset reference mapping
-        for n in sorted(nodes.values(), key=lambda x: x.name):
+        names = scene.names
+        for n in map(scene.nodes.__getitem__, sorted(range(len(scene)), key=names.__getitem__)):
             asset_refs = []
+            add_ref = asset_refs.append
             
             # Process components for asset references
-            if hasattr(n, 'comps') and n.comps:
-                for comp in n.comps:
-                    if comp.decoded_component:
-                        # Sprite frame references - enhanced to use sprite_frames registry
-                        if isinstance(comp.decoded_component, SpriteComponent):
-                            if hasattr(comp.decoded_component, '_resolved_frame_name') and comp.decoded_component._resolved_frame_name:
-                                frame_name = comp.decoded_component._resolved_frame_name
-                                frame_data = getattr(comp.decoded_component, '_resolved_frame_data', {})
-                                width = frame_data.get('width', 0)
-                                height = frame_data.get('height', 0)
-                                asset_refs.append(f'SpriteFrame[{frame_name}] ({width}×{height})')
-                            elif comp.decoded_component.sprite_frame:
-                                # Fallback: try to resolve using sprite_frames registry
-                                if hasattr(self, 'sprite_frames') and self.sprite_frames:
-                                    # Try direct node name match
-                                    if n.name in self.sprite_frames:
-                                        frame_data = self.sprite_frames[n.name]
-                                        width = frame_data.get('width', 0)
-                                        height = frame_data.get('height', 0)
-                                        asset_refs.append(f'SpriteFrame[{n.name}] ({width}×{height})')
-                                    else:
-                                        # Smart matching for common patterns
-                                        matched_frame = None
-                                        for frame_name in self.sprite_frames.keys():
-                                            if (frame_name.lower() in n.name.lower() or 
-                                                n.name.lower() in frame_name.lower()):
-                                                matched_frame = frame_name
-                                                break
-                                        
-                                        if matched_frame:
-                                            frame_data = self.sprite_frames[matched_frame]
-                                            width = frame_data.get('width', 0)
-                                            height = frame_data.get('height', 0)
-                                            asset_refs.append(f'SpriteFrame[{matched_frame}] ({width}×{height})')
-                                        else:
-                                            asset_refs.append(f"SpriteFrame[#{comp.decoded_component.sprite_frame}]")
-                                else:
-                                    asset_refs.append(f"SpriteFrame[#{comp.decoded_component.sprite_frame}]")
-                        
-                        # Font references for labels
-                        elif isinstance(comp.decoded_component, LabelComponent):
-                            if comp.decoded_component.font_asset:
-                                asset_refs.append(f"Font[asset_id={comp.decoded_component.font_asset}]")
+            for comp in n.comps:
+                dc = comp.decoded_component
+                if not dc:
+                    continue
+                # Sprite frame references - enhanced to use sprite_frames registry
+                if isinstance(dc, sprite_cls):
+                    frame_name = dc._resolved_frame_name
+                    if frame_name:
+                        frame_data = dc._resolved_frame_data
+                        add_ref(f'SpriteFrame[{frame_name}] ({frame_data.width}×{frame_data.height})')
+                    elif dc.sprite_frame:
+                        # Fallback: try to resolve using sprite_frames registry
+                        if sprite_frames:
+                            # Try direct node name match
+                            frame_data = sprite_frames.get(n.name)
+                            if frame_data is not None:
+                                add_ref(f'SpriteFrame[{n.name}] ({frame_data.width}×{frame_data.height})')
                             else:
-                                asset_refs.append("Font[default]")
-                        
-                        # Animation clip references with targets - enhanced to use embedded_animations
-                        elif isinstance(comp.decoded_component, AnimationComponent):
-                            if comp.decoded_component.clips:
-                                for clip in comp.decoded_component.clips:
-                                    targets = list(clip.curves.keys()) if hasattr(clip, 'curves') and clip.curves else []
-                                    if targets:
-                                        asset_refs.append(f"AnimationClip['{clip.name}'] → targets: [{', '.join(targets)}]")
-                                    else:
-                                        asset_refs.append(f"AnimationClip['{clip.name}']")
+                                # Smart matching for common patterns (pre-lowered frame names)
+                                matched_frame = None
+                                node_lower = n.name_lower
+                                for frame_lower, frame_name in sf_lower:
+                                    if frame_lower in node_lower or node_lower in frame_lower:
+                                        matched_frame = frame_name
+                                        break
+                                
+                                if matched_frame:
+                                    frame_data = sprite_frames[matched_frame]
+                                    add_ref(f'SpriteFrame[{matched_frame}] ({frame_data.width}×{frame_data.height})')
+                                else:
+                                    add_ref(f"SpriteFrame[#{dc.sprite_frame}]")
+                        else:
+                            add_ref(f"SpriteFrame[#{dc.sprite_frame}]")
+                
+                # Font references for labels
+                elif isinstance(dc, label_cls):
+                    if dc.font_asset:
+                        add_ref(f"Font[asset_id={dc.font_asset}]")
+                    else:
+                        add_ref("Font[default]")
+                
+                # Animation clip references with targets - enhanced to use embedded_animations
+                elif isinstance(dc, anim_cls):
+                    if dc.clips:
+                        for clip in dc.clips:
+                            targets = list(clip.curves.keys()) if hasattr(clip, 'curves') and clip.curves else []
+                            if targets:
+                                add_ref(f"AnimationClip['{clip.name}'] → targets: [{', '.join(targets)}]")
                             else:
-                                # Fallback: check for embedded animations
-                                if hasattr(self, 'embedded_animations') and self.embedded_animations:
-                                    clip_names = list(self.embedded_animations.keys())
-                                    if clip_names:
-                                        # Extract targets from the first available clip
-                                        clip_data = list(self.embedded_animations.values())[0]
-                                        targets = []
-                                        if 'curves' in clip_data and 'paths' in clip_data['curves']:
-                                            targets = list(clip_data['curves']['paths'].keys())
-                                        
-                                        if targets:
-                                            asset_refs.append(f"AnimationClip[{clip_names[0]}] → targets: [{', '.join(targets)}]")
-                                        else:
-                                            asset_refs.append(f"AnimationClip[{clip_names[0]}]")
+                                add_ref(f"AnimationClip['{clip.name}']")
+                    elif anim_fallback:
+                        # Fallback: first embedded animation
+                        add_ref(anim_fallback)
             
             # Collect traditional asset references if not already covered
             if n.assets:
@@ -2475,6 +3174,25 @@ def test_component_decoder():
     custom_component = engine.decode_component("cc.Custom", [99], [], helper)
     print(f"   Custom component: {custom_component.component_type}, properties: {custom_component.properties}")
     
+    # Test curve serialization round trip (rounding reaches vector values too)
+    print("\n5. Testing curve serialization:")
+    import tempfile
+    clip = AnimationClip("roundtrip", 1.0, curves={"node": {"position": [
+        {"time": 0.123456, "value": [1.23456, 2.0]},
+        {"time": 1, "value": 3.14159},
+    ]}})
+    expected = {"node": {"position": [
+        {"time": 0.12, "value": [1.23, 2.0]},
+        {"time": 1, "value": 3.14},
+    ]}}
+    with tempfile.TemporaryDirectory() as tmp:
+        out_path = Path(tmp) / "curves.json.gz"
+        serialize_curves(clip, out_path, ndigits=2)
+        with gzip.open(out_path, "rb") as fh:
+            restored = _json.loads(fh.read())
+    assert restored == expected, restored
+    print(f"   Round trip (ndigits=2): {restored['node']['position']}")
+    
     print("\n✓ ComponentDecoder engine test completed successfully!")
 
 if __name__=="__main__":
@@ -2482,6 +3200,7 @@ if __name__=="__main__":
     parser.add_argument("config", nargs="?", help="Bundle config JSON file")
     parser.add_argument("--test", action="store_true", help="Run ComponentDecoder engine test")
     parser.add_argument("--assets", action="store_true", help="Show full asset table (default: only referenced assets)")
+    parser.add_argument("--format-cache", metavar="DIR", help="Reuse parsed pack formats from DIR across runs")
     
     args = parser.parse_args()
     
@@ -2493,4 +3212,5 @@ if __name__=="__main__":
     else:
         bundle = CocosBundle(args.config)
         bundle.show_full_assets = args.assets
+        bundle.format_cache = Path(args.format_cache) if args.format_cache else None
         bundle.run()